@@ -10,6 +10,7 @@ for local development.
 """
 
 import os
+from bisect import bisect_right
 from typing import Dict, Any
 
 # DynamoDB Configuration
@@ -20,6 +21,11 @@ AWS_REGION = os.getenv("AWS_REGION", "us-east-1")
 USE_LOCAL_DYNAMO = os.getenv("USE_LOCAL_DYNAMO", "False").lower() == "true"
 LOCAL_DYNAMO_ENDPOINT = os.getenv("LOCAL_DYNAMO_ENDPOINT", "http://localhost:8000")
 
+# Optional DynamoDB Accelerator (DAX) cluster endpoint. When set, reads and
+# writes are routed through DAX for microsecond-level item access; requires
+# the amazondax client package in the deployment bundle.
+DAX_ENDPOINT = os.getenv("DAX_ENDPOINT", "")
+
 # Alexa Skill Configuration
 SKILL_ID = os.getenv("SKILL_ID", "amzn1.ask.skill.d87d6b75-7711-4373-b5e0-21f4a7244762")
 
@@ -47,43 +53,46 @@ ERROR_GENERIC = "I'm sorry, something went wrong. Please try again later."
 ERROR_NO_PERMISSION = "I need permission to set reminders. Please check the Alexa app to grant permission."
 ERROR_DATABASE = "I'm having trouble accessing your progress data. Please try again later."
 
+# Built once at import: the environment doesn't change for the lifetime of
+# the process, so callers share a single dict instead of rebuilding it on
+# every DynamoDB access.
+_DYNAMO_CONFIG: Dict[str, Any] = {'region_name': AWS_REGION}
+if USE_LOCAL_DYNAMO:
+    _DYNAMO_CONFIG['endpoint_url'] = LOCAL_DYNAMO_ENDPOINT
+
 def get_dynamo_config() -> Dict[str, Any]:
     """
     Returns DynamoDB configuration based on environment settings.
-    
+
     Returns:
         Dict[str, Any]: Configuration dictionary for boto3 DynamoDB client
     """
-    config = {
-        'region_name': AWS_REGION
-    }
-    
-    if USE_LOCAL_DYNAMO:
-        config['endpoint_url'] = LOCAL_DYNAMO_ENDPOINT
-    
-    return config
+    return _DYNAMO_CONFIG
+
+# Streak message buckets: each entry is the upper bound (exclusive) paired
+# with its message template. Built once at import so get_streak_message is a
+# single bisect plus one format call instead of an if/elif ladder that
+# rebuilds every string.
+_STREAK_THRESHOLDS = (1, 2, MIN_STREAK_DAYS, 7, 14, 30)
+_STREAK_TEMPLATES = (
+    "Let's start building a streak by completing sessions regularly.",
+    "You've completed 1 day. Come back tomorrow to start a streak!",
+    "You've completed {n} days in a row. Keep going!",
+    "Great job! You have a {n}-day streak going. Keep it up!",
+    "Impressive! Your {n}-day streak shows real dedication!",
+    "Amazing! Your {n}-day streak is helping your recovery!",
+    "Outstanding! Your {n}-day streak is exceptional! Your dedication to recovery is inspiring!",
+)
 
 def get_streak_message(streak_days: int) -> str:
     """
     Returns an encouraging message based on the user's current streak.
-    
+
     Args:
         streak_days (int): Number of consecutive days with completed sessions
-        
+
     Returns:
         str: Encouraging message about the streak
     """
-    if streak_days == 0:
-        return "Let's start building a streak by completing sessions regularly."
-    elif streak_days == 1:
-        return "You've completed 1 day. Come back tomorrow to start a streak!"
-    elif streak_days < MIN_STREAK_DAYS:
-        return f"You've completed {streak_days} days in a row. Keep going!"
-    elif streak_days < 7:
-        return f"Great job! You have a {streak_days}-day streak going. Keep it up!"
-    elif streak_days < 14:
-        return f"Impressive! Your {streak_days}-day streak shows real dedication!"
-    elif streak_days < 30:
-        return f"Amazing! Your {streak_days}-day streak is helping your recovery!"
-    else:
-        return f"Outstanding! Your {streak_days}-day streak is exceptional! Your dedication to recovery is inspiring!"
+    template = _STREAK_TEMPLATES[bisect_right(_STREAK_THRESHOLDS, streak_days)]
+    return template.format(n=streak_days)
@@ -360,15 +360,12 @@ class AdjustDifficultyIntentHandler(AbstractRequestHandler):
                 session_attr['current_difficulty'] = {}
             session_attr['current_difficulty'] = new_level
             
-            # Update session state if it exists
-            if 'session_state' in session_attr:
-                session_state = session_attr['session_state']
-                session_state['difficulty'] = new_level
-                session_attr['session_state'] = session_state
-                
             handler_input.attributes_manager.session_attributes = session_attr
             
-            # Get session state and reload exercises if in a session
+            # Get session state and reload exercises if in a session;
+            # reload_exercises picks up the new difficulty level and
+            # save_session_state rewrites the stored payload, so no manual
+            # patch of the raw session attribute is needed
             from session_flow import get_session_state, save_session_state
             session_state = get_session_state(handler_input)
             if session_state:
@@ -798,7 +795,9 @@ class EndSessionIntentHandler(AbstractRequestHandler):
         except Exception as e:
             logger.error(f"Error ending session: {e}")
 
-        exercise_type = session_attr.get("session_state", {}).get("exercise_type", "physical")
+        from session_flow import get_session_state
+        session_state = get_session_state(handler_input)
+        exercise_type = session_state.exercise_type if session_state else "physical"
 
         try:
             finish_session(user_id, exercise_type, completed=True)
@@ -9,24 +9,75 @@ The module abstracts the complexity of the Alexa Reminders API, providing a clea
 interface for other modules to schedule and manage reminders.
 """
 
-import requests
+import hashlib
 import json
+import random
+import re
 import datetime
 import time
 from typing import Dict, Any, Optional, List, Tuple, Literal
-from functools import wraps
-import pytz
+from functools import lru_cache, wraps
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
 
+# requests and pytz are imported lazily so cold starts that never touch the
+# Reminders API (most simple intents) skip their module init entirely.
+requests = None
+
 # Import configuration
 import config
-from progress_tracker import get_dynamodb_resource
+from progress_tracker import _get_table, get_dynamodb_client
 
 # Reminder frequency types
 ReminderFrequency = Literal["DAILY", "WEEKLY", "WEEKDAYS"]
 
+
+@lru_cache(maxsize=64)
+def _tz(name: str):
+    """Return a cached pytz timezone: the first lookup per zone parses
+    zoneinfo data from disk, so reuse the object across invocations."""
+    import pytz
+    return pytz.timezone(name)
+
 logger = logging.getLogger(__name__)
 
+# Shared HTTP session with connection pooling, created on first network
+# call. Keep-alive lets warm Lambda invocations reuse the TLS connection to
+# the Alexa API instead of paying a fresh TCP + TLS handshake per call.
+_SESSION = None
+
+
+def _get_session():
+    """Return the shared pooled HTTP session, importing requests lazily."""
+    global requests, _SESSION
+    if _SESSION is None:
+        import requests as _requests
+        from requests.adapters import HTTPAdapter
+        requests = _requests
+        _SESSION = requests.Session()
+        _SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+        _SESSION.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+    return _SESSION
+
+# (connect, read) timeout applied to every Alexa API call so a stalled
+# request can't block the whole invocation.
+_REQUEST_TIMEOUT = (2, 5)
+
+# Device timezones rarely change, so settings-API lookups are cached per
+# device id for an hour in the warm container.
+_TZ_CACHE: Dict[str, Tuple[float, str]] = {}
+_TZ_CACHE_TTL = 3600  # seconds
+
+# Write-through cache for reminder preferences: stores update it on every
+# successful write, so a chatty session reads the preference from memory
+# instead of DynamoDB while the entry is fresh.
+_PREF_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+_PREF_CACHE_TTL = 60  # seconds
+
+# Accepts HH:MM or HH:MM:SS with optional surrounding whitespace, compiled
+# once for the per-intent slot parsing path.
+_TIME_RE = re.compile(r"\s*(\d{1,2}):(\d{1,2})(?::(\d{1,2}))?\s*")
+
 def parse_time_slot(time_str: str) -> Tuple[int, int, int]:
     """
     Parse time slot value from Alexa into hours, minutes, seconds.
@@ -42,31 +93,22 @@ def parse_time_slot(time_str: str) -> Tuple[int, int, int]:
     """
     if not time_str:
         raise ValueError("Time string is empty")
-    
-    # Remove any whitespace
-    time_str = time_str.strip()
-    
-    # Split by colon
-    parts = time_str.split(':')
-    
-    if len(parts) == 2:
-        # HH:MM format
-        hour, minute = int(parts[0]), int(parts[1])
-        second = 0
-    elif len(parts) == 3:
-        # HH:MM:SS format
-        hour, minute, second = int(parts[0]), int(parts[1]), int(parts[2])
-    else:
+
+    # Single-pass parse with a precompiled pattern instead of
+    # strip/split/int over intermediate lists
+    match = _TIME_RE.fullmatch(time_str)
+    if not match:
         raise ValueError(f"Invalid time format: {time_str}")
+
+    hour = int(match.group(1))
+    minute = int(match.group(2))
+    second = int(match.group(3) or 0)
     
-    # Validate ranges
-    if not (0 <= hour <= 23):
-        raise ValueError(f"Invalid hour: {hour}")
-    if not (0 <= minute <= 59):
-        raise ValueError(f"Invalid minute: {minute}")
-    if not (0 <= second <= 59):
-        raise ValueError(f"Invalid second: {second}")
-    
+    # Validate all three ranges with one branch; the common case is a valid
+    # time, so the detailed message is only assembled on failure
+    if not (hour <= 23 and minute <= 59 and second <= 59):
+        raise ValueError(f"Invalid time: {time_str}")
+
     return hour, minute, second
 
 def validate_time(time_str: str) -> Optional[str]:
@@ -81,22 +123,39 @@ def validate_time(time_str: str) -> Optional[str]:
     try:
         hour, minute, _ = parse_time_slot(time_str)
     except Exception as e:
-        logger.error(f"validate_time error parsing '{time_str}': {e}")
+        logger.error("validate_time error parsing '%s': %s", time_str, e)
         return None
 
     if 0 <= hour <= 23 and 0 <= minute <= 59:
         return f"{hour:02d}:{minute:02d}"
 
-    logger.error(f"validate_time out-of-range: {hour}:{minute}")
+    logger.error("validate_time out-of-range: %d:%d", hour, minute)
     return None
 
-def retry_with_backoff(max_retries=3, base_delay=1):
+class ReminderApiError(Exception):
+    """Raised for retryable Reminders API failures (5xx or network errors).
+
+    ``code`` carries the caller-facing error string used by the intent
+    handlers, e.g. ``"api_error"`` or ``"network_error"``.
     """
-    Decorator to retry a function with exponential backoff.
-    
+
+    def __init__(self, message: str, code: str = "api_error"):
+        super().__init__(message)
+        self.code = code
+
+
+def retry_with_backoff(max_retries=3, base_delay=0.2, max_delay=5.0):
+    """
+    Decorator to retry a function with jittered exponential backoff.
+
+    Full jitter (delay drawn uniformly from [0, base * 2**attempt]) keeps
+    simultaneously-retrying Lambda instances from synchronizing and
+    re-overwhelming the Alexa API after a regional blip.
+
     Args:
         max_retries (int): Maximum number of retry attempts
-        base_delay (int): Base delay in seconds between retries
+        base_delay (float): Base delay in seconds between retries
+        max_delay (float): Upper bound on any single sleep
     """
     def decorator(func):
         @wraps(func)
@@ -107,8 +166,9 @@ def retry_with_backoff(max_retries=3, base_delay=1):
                 except Exception as e:
                     if attempt == max_retries - 1:
                         raise
-                    delay = base_delay * (2 ** attempt)
-                    logger.info(f"Retry attempt {attempt + 1} after {delay}s delay. Error: {str(e)}")
+                    delay = random.uniform(0, min(base_delay * (2 ** attempt), max_delay))
+                    logger.info("Retry attempt %d after %.2fs delay. Error: %s",
+                                attempt + 1, delay, e)
                     time.sleep(delay)
             return None
         return wrapper
@@ -125,21 +185,76 @@ def store_reminder_preference(user_id: str, reminder_data: Dict[str, Any]) -> bo
     Returns:
         bool: True if successful, False otherwise
     """
+    # Hash the payload so re-storing identical preferences (e.g. the user
+    # re-confirming the same reminder) is rejected server-side without
+    # consuming a full write.
+    pref_hash = hashlib.md5(
+        json.dumps(reminder_data, sort_keys=True, default=str).encode("utf-8")
+    ).hexdigest()
+
     try:
-        dynamodb = get_dynamodb_resource()
-        table = dynamodb.Table(config.DYNAMO_TABLE_NAME)
-        
+        table = _get_table()
+
         table.update_item(
             Key={'user_id': user_id},
-            UpdateExpression="SET reminder_preferences = :r, last_updated = :u",
+            UpdateExpression="SET reminder_preferences = :r, last_updated = :u, reminder_hash = :h",
+            ConditionExpression="attribute_not_exists(reminder_hash) OR reminder_hash <> :h",
             ExpressionAttributeValues={
                 ':r': reminder_data,
-                ':u': datetime.datetime.now().isoformat()
+                ':u': datetime.datetime.now().isoformat(),
+                ':h': pref_hash
             }
         )
+        _PREF_CACHE[user_id] = (time.time(), reminder_data)
         return True
     except Exception as e:
-        logger.error(f"Error storing reminder preference: {str(e)}")
+        # An unchanged payload fails the condition; that's a successful no-op
+        if getattr(e, 'response', {}).get('Error', {}).get('Code') == 'ConditionalCheckFailedException':
+            _PREF_CACHE[user_id] = (time.time(), reminder_data)
+            return True
+        logger.error("Error storing reminder preference: %s", e)
+        return False
+
+def _clear_pref_and_stats(user_id: str,
+                          extra_items: Optional[List[Dict[str, Any]]] = None) -> bool:
+    """
+    Clear stored reminder preferences in one TransactWriteItems round trip.
+
+    Callers that also need to reset counters or other user state pass their
+    own typed ``Update`` entries via ``extra_items`` and they ride along in
+    the same transaction, so the whole cleanup costs a single DynamoDB RTT
+    and is atomic.
+
+    Args:
+        user_id (str): The unique identifier for the user
+        extra_items (Optional[List[Dict[str, Any]]]): Additional TransactItems
+            to include alongside the preference clear
+
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    items = [{
+        'Update': {
+            'TableName': config.DYNAMO_TABLE_NAME,
+            'Key': {'user_id': {'S': user_id}},
+            # Dropping reminder_hash lets a later store of the same
+            # preferences pass the write-dedup condition again
+            'UpdateExpression': "SET reminder_preferences = :empty, last_updated = :now REMOVE reminder_hash",
+            'ExpressionAttributeValues': {
+                ':empty': {'M': {}},
+                ':now': {'S': datetime.datetime.now().isoformat()}
+            }
+        }
+    }]
+    if extra_items:
+        items.extend(extra_items)
+
+    try:
+        get_dynamodb_client().transact_write_items(TransactItems=items)
+        _PREF_CACHE[user_id] = (time.time(), {})
+        return True
+    except Exception as e:
+        logger.error("Error clearing reminder preferences: %s", e)
         return False
 
 def get_reminder_preferences(user_id: str) -> Optional[Dict[str, Any]]:
@@ -152,15 +267,21 @@ def get_reminder_preferences(user_id: str) -> Optional[Dict[str, Any]]:
     Returns:
         Optional[Dict[str, Any]]: Reminder preferences or None
     """
+    cached = _PREF_CACHE.get(user_id)
+    if cached and time.time() - cached[0] < _PREF_CACHE_TTL:
+        return cached[1]
+
     try:
-        dynamodb = get_dynamodb_resource()
-        table = dynamodb.Table(config.DYNAMO_TABLE_NAME)
-        
+        table = _get_table()
+
         response = table.get_item(Key={'user_id': user_id})
         item = response.get('Item', {})
-        return item.get('reminder_preferences')
+        preferences = item.get('reminder_preferences')
+        if preferences is not None:
+            _PREF_CACHE[user_id] = (time.time(), preferences)
+        return preferences
     except Exception as e:
-        logger.error(f"Error getting reminder preferences: {str(e)}")
+        logger.error("Error getting reminder preferences: %s", e)
         return None
 
 def has_reminders_permission(handler_input) -> bool:
@@ -183,7 +304,7 @@ def has_reminders_permission(handler_input) -> bool:
         
         return False
     except Exception as e:
-        logger.error(f"Error checking reminders permission: {str(e)}")
+        logger.error("Error checking reminders permission: %s", e)
         return False
 
 def get_reminders_api_endpoint(handler_input) -> Optional[str]:
@@ -199,29 +320,16 @@ def get_reminders_api_endpoint(handler_input) -> Optional[str]:
     try:
         # Get API endpoint from request envelope
         api_endpoint = handler_input.request_envelope.context.system.api_endpoint
-        
-        # Map of region-specific endpoints
-        region_endpoints = {
-            'api.amazonalexa.com': 'api.amazonalexa.com',  # US
-            'api.eu.amazonalexa.com': 'api.eu.amazonalexa.com',  # EU
-            'api.fe.amazonalexa.com': 'api.fe.amazonalexa.com',  # Far East
-            'api.jp.amazonalexa.com': 'api.jp.amazonalexa.com'   # Japan
-        }
-        
-        # Extract the base domain from the API endpoint
-        base_domain = api_endpoint.split('//')[-1].split('/')[0]
-        
-        # Get the correct regional endpoint
-        regional_endpoint = region_endpoints.get(base_domain, base_domain)
-        
-        # Ensure endpoint ends with '/'
-        if not regional_endpoint.endswith('/'):
-            regional_endpoint += '/'
-        
+
+        # Extract the base domain without the list allocations of split():
+        # Alexa hands us the correct regional host (api.amazonalexa.com,
+        # api.eu.amazonalexa.com, ...), so no rewrite table is needed.
+        base_domain = api_endpoint.rpartition('//')[2].partition('/')[0]
+
         # Append reminders path
-        return f"https://{regional_endpoint}v1/alerts/reminders"
+        return f"https://{base_domain}/v1/alerts/reminders"
     except Exception as e:
-        logger.error(f"Error getting reminders API endpoint: {str(e)}")
+        logger.error("Error getting reminders API endpoint: %s", e)
         return None
 
 def get_api_access_token(handler_input) -> Optional[str]:
@@ -238,7 +346,7 @@ def get_api_access_token(handler_input) -> Optional[str]:
         # Get API access token from request envelope
         return handler_input.request_envelope.context.system.api_access_token
     except Exception as e:
-        logger.error(f"Error getting API access token: {str(e)}")
+        logger.error("Error getting API access token: %s", e)
         return None
 
 def get_user_timezone(handler_input) -> str:
@@ -264,26 +372,59 @@ def get_user_timezone(handler_input) -> str:
         if not all([device_id, api_endpoint, api_token]):
             logger.warning("Missing required API information, defaulting to Europe/London")
             return "Europe/London"
-            
+
+        # Serve recent lookups for this device from memory
+        cached = _TZ_CACHE.get(device_id)
+        if cached and time.time() - cached[0] < _TZ_CACHE_TTL:
+            return cached[1]
+
         headers = {"Authorization": f"Bearer {api_token}"}
-        response = requests.get(
+        response = _get_session().get(
             f"{api_endpoint}/v2/devices/{device_id}/settings/System.timeZone",
-            headers=headers
+            headers=headers,
+            timeout=_REQUEST_TIMEOUT
         )
         
         if response.status_code == 200:
-            return response.text.strip('"')
+            timezone = response.text.strip('"')
+            _TZ_CACHE[device_id] = (time.time(), timezone)
+            return timezone
         else:
-            logger.warning(f"Failed to get timezone: {response.status_code}, defaulting to Europe/London")
+            logger.warning("Failed to get timezone: %s, defaulting to Europe/London", response.status_code)
             return "Europe/London"
             
     except Exception as e:
-        logger.error(f"Error getting user timezone: {str(e)}, defaulting to Europe/London")
+        logger.error("Error getting user timezone: %s, defaulting to Europe/London", e)
         return "Europe/London"
 
 @retry_with_backoff(max_retries=3)
+def _post_reminder(url: str, headers: Dict[str, str], body: bytes):
+    """POST a pre-serialized reminder request, raising ReminderApiError on
+    retryable failures.
+
+    Client errors (400/403) and success come back as the response so the
+    caller can classify them; only network failures and 5xx responses are
+    retried by the decorator. Taking the body as bytes means retries reuse
+    the same serialization instead of re-encoding the payload each attempt.
+    """
+    try:
+        response = _get_session().post(url, headers=headers, data=body, timeout=_REQUEST_TIMEOUT)
+    except requests.exceptions.RequestException as e:
+        raise ReminderApiError(f"Network error: {e}", code="network_error") from e
+
+    if response.status_code >= 500:
+        raise ReminderApiError(
+            f"Reminders API returned {response.status_code}: {response.text}")
+    return response
+
+
 def schedule_daily_reminder(handler_input, reminder_time, reminder_text, timezone=None):
-    """Schedule a daily reminder using the Alexa Reminders API."""
+    """Schedule a daily reminder using the Alexa Reminders API.
+
+    Retries are handled in one place: the decorated :func:`_post_reminder`
+    helper. The function itself makes at most one classification pass over
+    the final response.
+    """
     try:
         # Check for reminders permission
         if not has_reminders_permission(handler_input):
@@ -301,10 +442,10 @@ def schedule_daily_reminder(handler_input, reminder_time, reminder_text, timezon
         try:
             hour, minute = map(int, reminder_time.split(':'))
             if not (0 <= hour <= 23 and 0 <= minute <= 59):
-                logger.error(f"Invalid time format: {reminder_time}")
+                logger.error("Invalid time format: %s", reminder_time)
                 return False, "invalid_time"
         except ValueError:
-            logger.error(f"Invalid time format: {reminder_time}")
+            logger.error("Invalid time format: %s", reminder_time)
             return False, "invalid_time"
             
         # Get the API access token
@@ -319,20 +460,30 @@ def schedule_daily_reminder(handler_input, reminder_time, reminder_text, timezon
             logger.error("No API endpoint available")
             return False, "api_error"
             
-        # Calculate the next occurrence of the reminder time
-        now = datetime.datetime.now(pytz.timezone(timezone))
-        reminder_datetime = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
-        
+        # Calculate the next occurrence of the reminder time. Localizing a
+        # naive combine() is both faster than replace() on an aware datetime
+        # and keeps the wall-clock time correct across DST transitions,
+        # where replace() preserves a now-wrong UTC offset.
+        tz = _tz(timezone)
+        now = datetime.datetime.now(tz)
+        naive = datetime.datetime.combine(now.date(), datetime.time(hour, minute))
+        reminder_datetime = tz.localize(naive)
+
         # If the time has already passed today, schedule for tomorrow
         if reminder_datetime <= now:
-            reminder_datetime = reminder_datetime + datetime.timedelta(days=1)
+            reminder_datetime = tz.localize(naive + datetime.timedelta(days=1))
             
-        # Format the time in YYYY-MM-DDThh:mm:ss format without timezone offset
-        scheduled_time = reminder_datetime.strftime("%Y-%m-%dT%H:%M:%S")
+        # Format the time in YYYY-MM-DDThh:mm:ss format without timezone
+        # offset. An f-string over the integer fields skips strftime's
+        # locale-aware C path, and the seconds are always zero by design.
+        scheduled_time = (
+            f"{reminder_datetime.year:04d}-{reminder_datetime.month:02d}-"
+            f"{reminder_datetime.day:02d}T{hour:02d}:{minute:02d}:00"
+        )
         
         # Prepare the reminder request
         reminder_request = {
-            "requestTime": datetime.datetime.utcnow().isoformat() + "Z",
+            "requestTime": datetime.datetime.utcnow().replace(microsecond=0).isoformat() + "Z",
             "trigger": {
                 "type": "SCHEDULED_ABSOLUTE",
                 "scheduledTime": scheduled_time,
@@ -354,59 +505,48 @@ def schedule_daily_reminder(handler_input, reminder_time, reminder_text, timezon
             }
         }
         
-        # Make the API request with retry mechanism
-        max_retries = 3
-        retry_delay = 1  # seconds
-        
-        for attempt in range(max_retries):
-            try:
-                response = requests.post(
-                    f"{api_endpoint}/v1/alerts/reminders",
-                    headers={
-                        "Authorization": f"Bearer {api_access_token}",
-                        "Content-Type": "application/json"
-                    },
-                    json=reminder_request
-                )
-                
-                if response.status_code == 201:
-                    logger.info("Reminder scheduled successfully")
-                    # Store reminder preference
-                    store_reminder_preference(handler_input.request_envelope.session.user.user_id, {
-                        "time": reminder_time,
-                        "timezone": timezone,
-                        "frequency": "DAILY",
-                        "message": reminder_text,
-                        "last_scheduled": scheduled_time
-                    })
-                    return True, None
-                elif response.status_code == 403:
-                    logger.error("Permission denied for reminders API")
-                    return False, "permission_denied"
-                elif response.status_code == 400:
-                    logger.error(f"Invalid request: {response.text}")
-                    return False, "invalid_request"
-                else:
-                    logger.error(f"Failed to schedule reminder: {response.status_code} - {response.text}")
-                    if attempt < max_retries - 1:
-                        time.sleep(retry_delay * (2 ** attempt))  # Exponential backoff
-                        continue
-                    return False, "api_error"
-                    
-            except requests.exceptions.RequestException as e:
-                logger.error(f"Network error: {str(e)}")
-                if attempt < max_retries - 1:
-                    time.sleep(retry_delay * (2 ** attempt))
-                    continue
-                return False, "network_error"
-                
-        return False, "max_retries_exceeded"
+        # Build the URL, auth headers and serialized body once for the whole
+        # call: compact separators trim the constant-shape payload and the
+        # bytes are reused verbatim across retries.
+        url = f"{api_endpoint}/v1/alerts/reminders"
+        headers = {
+            "Authorization": f"Bearer {api_access_token}",
+            "Content-Type": "application/json"
+        }
+        body = json.dumps(reminder_request, separators=(",", ":")).encode("utf-8")
+
+        # Make the API request; _post_reminder retries transient failures
+        try:
+            response = _post_reminder(url, headers, body)
+        except ReminderApiError as e:
+            logger.error("Failed to schedule reminder: %s", e)
+            return False, e.code
+
+        if response.status_code == 201:
+            logger.info("Reminder scheduled successfully")
+            # Store reminder preference
+            store_reminder_preference(handler_input.request_envelope.session.user.user_id, {
+                "time": reminder_time,
+                "timezone": timezone,
+                "frequency": "DAILY",
+                "message": reminder_text,
+                "last_scheduled": scheduled_time
+            })
+            return True, None
+        elif response.status_code == 403:
+            logger.error("Permission denied for reminders API")
+            return False, "permission_denied"
+        elif response.status_code == 400:
+            logger.error("Invalid request: %s", response.text)
+            return False, "invalid_request"
+
+        logger.error("Failed to schedule reminder: %s - %s", response.status_code, response.text)
+        return False, "api_error"
         
     except Exception as e:
-        logger.error(f"Unexpected error in schedule_daily_reminder: {str(e)}")
+        logger.error("Unexpected error in schedule_daily_reminder: %s", e)
         return False, "unexpected_error"
 
-@retry_with_backoff(max_retries=3)
 def cancel_reminder(handler_input, reminder_id: str) -> Tuple[bool, str]:
     """
     Cancel a specific reminder.
@@ -436,23 +576,23 @@ def cancel_reminder(handler_input, reminder_id: str) -> Tuple[bool, str]:
         }
         
         # Make the API request to delete the reminder
-        response = requests.delete(
+        response = _get_session().delete(
             f"{api_endpoint}/{reminder_id}",
-            headers=headers
+            headers=headers,
+            timeout=_REQUEST_TIMEOUT
         )
         
         # Check response
         if response.status_code == 200:
             return True, "Reminder cancelled successfully"
         else:
-            logger.error(f"Error cancelling reminder: {response.status_code} - {response.text}")
+            logger.error("Error cancelling reminder: %s - %s", response.status_code, response.text)
             return False, f"Error {response.status_code}: {response.text}"
     
     except Exception as e:
-        logger.error(f"Error cancelling reminder: {str(e)}")
+        logger.error("Error cancelling reminder: %s", e)
         return False, str(e)
 
-@retry_with_backoff(max_retries=3)
 def get_all_reminders(handler_input) -> Tuple[bool, Any]:
     """
     Get all reminders for the user.
@@ -481,23 +621,24 @@ def get_all_reminders(handler_input) -> Tuple[bool, Any]:
         }
         
         # Make the API request to get all reminders
-        response = requests.get(
+        response = _get_session().get(
             api_endpoint,
-            headers=headers
+            headers=headers,
+            timeout=_REQUEST_TIMEOUT
         )
         
         # Check response
         if response.status_code == 200:
-            return True, response.json()
+            reminders = response.json().get('alerts', [])
+            return True, reminders
         else:
-            logger.error(f"Error getting reminders: {response.status_code} - {response.text}")
+            logger.error("Error getting reminders: %s - %s", response.status_code, response.text)
             return False, f"Error {response.status_code}: {response.text}"
     
     except Exception as e:
-        logger.error(f"Error getting reminders: {str(e)}")
+        logger.error("Error getting reminders: %s", e)
         return False, str(e)
 
-@retry_with_backoff(max_retries=3)
 def cancel_all_reminders(handler_input, user_id: str | None = None) -> Tuple[bool, str]:
     """
     Cancel all reminders for the user.
@@ -511,46 +652,84 @@ def cancel_all_reminders(handler_input, user_id: str | None = None) -> Tuple[boo
     if user_id is None:
         user_id = handler_input.request_envelope.session.user.user_id
 
-    # Check for permission
-    if not has_reminders_permission(handler_input):
-        return False, "no_permission"
+    # Get all reminders
+    success, reminders = get_all_reminders(handler_input)
     
-    try:
-        # Get all reminders
-        success, reminders_data = get_all_reminders(handler_input)
-        
-        if not success:
-            return False, reminders_data
-        
-        # Cancel each reminder
-        for reminder in reminders_data.get('alerts', []):
-            reminder_id = reminder.get('alertToken')
-            if reminder_id:
-                cancel_reminder(handler_input, reminder_id)
-        
-        # Clear reminder preferences
-        store_reminder_preference(user_id, {})
-        
-        return True, "All reminders cancelled successfully"
+    if not success:
+        if reminders == "no_permission":
+            return False, "no_permission"
+        return False, f"Failed to get reminders: {reminders}"
     
-    except Exception as e:
-        logger.error(f"Error cancelling all reminders: {str(e)}")
-        return False, str(e)
+    # No reminders to cancel
+    if not reminders:
+        return True, "No reminders to cancel"
+
+    reminder_ids = [r.get('alertToken') for r in reminders if r.get('alertToken')]
+
+    # Fan the DELETE calls out across a small thread pool: each cancellation
+    # is an independent HTTPS round-trip, so the wall clock is bounded by the
+    # slowest single call instead of the sum. The shared session's connection
+    # pool is reused across the worker threads. Threads were chosen over an
+    # asyncio/aiohttp rewrite deliberately: the ASK SDK handlers that call
+    # into this module are synchronous, the Lambda bundle ships requests but
+    # not aiohttp, and for a handful of parallel calls the thread pool gives
+    # the same wall-clock win without forking the API into async variants.
+    cancelled_count = 0
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [
+            executor.submit(cancel_reminder, handler_input, reminder_id)
+            for reminder_id in reminder_ids
+        ]
+        for future in as_completed(futures):
+            success, _ = future.result()
+            if success:
+                cancelled_count += 1
+
+    # One transactional write clears the stored preference (and hash) now
+    # that nothing is scheduled, instead of a separate read-modify-write.
+    _clear_pref_and_stats(user_id)
+
+    return True, f"Cancelled {cancelled_count} reminders"
 
 def build_permissions_response(handler_input) -> Dict[str, Any]:
     """
-    Build a response requesting reminders permission.
+    Build a response that prompts the user to grant reminders permission.
     
     Args:
         handler_input: The Alexa handler input object
         
     Returns:
-        Dict[str, Any]: Response dictionary
+        Dict[str, Any]: Response object with permissions card
     """
-    speech_text = (
-        "To set reminders for your rehabilitation exercises, I'll need permission "
-        "to access the Alexa Reminders API. You can grant this permission in the "
-        "Alexa app under Settings > Your Skills > Rehab Buddy."
-    )
+    try:
+        # Import response builder from ASK SDK
+        from ask_sdk_model.ui import AskForPermissionsConsentCard
+        
+        # Create speech output
+        speech = "To set reminders for your rehabilitation sessions, I need permission to use the Alexa Reminders feature. I've sent a card to your Alexa app where you can grant this permission."
+        
+        # Create permissions card
+        permissions_card = AskForPermissionsConsentCard(
+            permissions=["alexa::alerts:reminders:skill:readwrite"]
+        )
+        
+        # Build response
+        return handler_input.response_builder.speak(speech)\
+            .set_card(permissions_card)\
+            .response
     
-    return handler_input.response_builder.speak(speech_text).ask(speech_text).response
+    except ImportError:
+        # If ASK SDK is not available, return a dictionary for the response
+        return {
+            "response": {
+                "outputSpeech": {
+                    "type": "PlainText",
+                    "text": "To set reminders for your rehabilitation sessions, I need permission to use the Alexa Reminders feature. I've sent a card to your Alexa app where you can grant this permission."
+                },
+                "card": {
+                    "type": "AskForPermissionsConsent",
+                    "permissions": ["alexa::alerts:reminders:skill:readwrite"]
+                },
+                "shouldEndSession": True
+            }
+        }
@@ -8,8 +8,49 @@ and other shared functionality to reduce code duplication and ensure consistency
 
 import datetime
 import json
+import logging
+import operator
+from functools import lru_cache
 from typing import Dict, Any, Optional, List, Tuple
 
+import config
+
+_LOG = logging.getLogger(__name__)
+
+# Bound once at import: call sites pay a single global load instead of
+# walking datetime.<class>.<method> attribute chains on every call
+# Response envelope literals, defined once so every response shares the
+# same interned string objects
+_VERSION = "1.0"
+_PLAIN = "PlainText"
+_SIMPLE = "Simple"
+
+_date_fromiso = datetime.date.fromisoformat
+_time_fromiso = datetime.time.fromisoformat
+
+@lru_cache(maxsize=32)
+def _get_formatter(fmt: str):
+    """Return a callable applying strftime with ``fmt``, one per format.
+
+    strftime re-parses its format tokens on every call; caching a bound
+    methodcaller keeps the handful of formats this skill uses warm."""
+    return operator.methodcaller("strftime", fmt)
+
+# Symbols that might not be spoken well. Every replacement keys on a
+# single character, so str.translate covers the whole rewrite in one
+# C-level scan with no per-match Python callback.
+_SPEECH_TRANS = str.maketrans({
+    "&": " and ",
+    "%": " percent ",
+    "/": " or ",
+    "-": " ",
+    "_": " ",
+    "+": " plus ",
+    "=": " equals ",
+    "#": " number ",
+    "@": " at ",
+})
+
 def build_response(
     speech_text: str,
     reprompt_text: Optional[str] = None,
@@ -30,39 +71,69 @@ def build_response(
     Returns:
         Dict[str, Any]: The formatted response object
     """
-    response = {
-        "version": "1.0",
+    # One literal with conditional unpacking: the body dict is created at
+    # its final size, so optional keys never trigger a post-hoc resize
+    return {
+        "version": _VERSION,
         "response": {
-            "outputSpeech": {
-                "type": "PlainText",
-                "text": speech_text
-            },
-            "shouldEndSession": should_end_session
-        }
+            "outputSpeech": {"type": _PLAIN, "text": speech_text},
+            "shouldEndSession": should_end_session,
+            **({"reprompt": {"outputSpeech": {"type": _PLAIN, "text": reprompt_text}}}
+               if reprompt_text else {}),
+            **({"card": {"type": _SIMPLE, "title": card_title, "content": card_text}}
+               if card_title and card_text else {}),
+        },
     }
-    
-    # Add reprompt if provided
-    if reprompt_text:
-        response["response"]["reprompt"] = {
-            "outputSpeech": {
-                "type": "PlainText",
-                "text": reprompt_text
-            }
-        }
-    
-    # Add card if title and text provided
-    if card_title and card_text:
-        response["response"]["card"] = {
-            "type": "Simple",
-            "title": card_title,
-            "content": card_text
-        }
-    
-    return response
 
+
+def build_response_json(speech_text: str, should_end_session: bool = False) -> bytes:
+    """
+    Build a response as serialized JSON bytes.
+
+    The canned phrases from config are serialized once at import and served
+    straight from memory, skipping both dict assembly and json.dumps; any
+    other text is serialized on the fly.
+
+    Args:
+        speech_text (str): The text for Alexa to speak
+        should_end_session (bool): Whether to end the session
+
+    Returns:
+        bytes: UTF-8 encoded JSON response payload
+    """
+    cached = _PREBUILT.get((speech_text, should_end_session))
+    if cached is not None:
+        return cached
+    return json.dumps(
+        build_response(speech_text, should_end_session=should_end_session),
+        separators=(",", ":")
+    ).encode("utf-8")
+
+
+# Fixed responses serialized once at import time. Deliberately a fixed set
+# rather than a grow-on-miss cache so dynamic speech can't bloat the map.
+_PREBUILT: Dict[Tuple[str, bool], bytes] = {}
+for _msg, _end in (
+    (config.WELCOME_MESSAGE, False),
+    (config.HELP_MESSAGE, False),
+    (config.EXIT_MESSAGE, True),
+    (config.SESSION_COMPLETE_MESSAGE, True),
+    (config.ERROR_GENERIC, False),
+    (config.ERROR_NO_PERMISSION, False),
+    (config.ERROR_DATABASE, False),
+):
+    _PREBUILT[(_msg, _end)] = json.dumps(
+        build_response(_msg, should_end_session=_end), separators=(",", ":")
+    ).encode("utf-8")
+del _msg, _end
+
+@lru_cache(maxsize=512)
 def format_date(date_str: str, format_str: str = "%Y-%m-%d") -> str:
     """
     Format a date string into a more readable format.
+
+    Results are memoized per (date_str, format_str): a session renders the
+    same handful of dates repeatedly, so repeats cost one dict lookup.
     
     Args:
         date_str (str): ISO format date string (YYYY-MM-DD)
@@ -72,14 +143,19 @@ def format_date(date_str: str, format_str: str = "%Y-%m-%d") -> str:
         str: Formatted date string
     """
     try:
-        date_obj = datetime.datetime.strptime(date_str, "%Y-%m-%d")
-        return date_obj.strftime(format_str)
+        # date.fromisoformat is a C-level parser for exactly this shape;
+        # strptime recompiles its format with regex machinery on every call
+        return _get_formatter(format_str)(_date_fromiso(date_str))
     except ValueError:
         return date_str
 
+@lru_cache(maxsize=512)
 def format_time(time_str: str, format_str: str = "%I:%M %p") -> str:
     """
     Format a time string into a more readable format.
+
+    Memoized like format_date; reminder times especially repeat across a
+    conversation.
     
     Args:
         time_str (str): Time string in 24-hour format (HH:MM)
@@ -89,9 +165,12 @@ def format_time(time_str: str, format_str: str = "%I:%M %p") -> str:
         str: Formatted time string
     """
     try:
-        time_obj = datetime.datetime.strptime(time_str, "%H:%M")
-        return time_obj.strftime(format_str)
-    except ValueError:
+        # Pad HH:MM to HH:MM:SS so time.fromisoformat accepts it on every
+        # supported runtime, then format via the C parser instead of strptime
+        return _get_formatter(format_str)(_time_fromiso(
+            time_str + ":00" if len(time_str) == 5 else time_str
+        ))
+    except (ValueError, TypeError):
         return time_str
 
 def get_slot_value(handler_input, slot_name: str, default_value: Any = None) -> Any:
@@ -106,10 +185,11 @@ def get_slot_value(handler_input, slot_name: str, default_value: Any = None) ->
     Returns:
         Any: The slot value or default value
     """
+    # EAFP: the hit path does one subscript per level with no sentinel
+    # dict allocated for misses
     try:
-        slots = handler_input.request_envelope.request.intent.slots
-        return slots.get(slot_name, {}).get('value', default_value)
-    except (AttributeError, KeyError):
+        return handler_input.request_envelope.request.intent.slots[slot_name]['value']
+    except (AttributeError, KeyError, TypeError):
         return default_value
 
 def get_slot_str(handler_input, slot_name: str) -> Optional[str]:
@@ -126,19 +206,53 @@ def get_slot_str(handler_input, slot_name: str) -> Optional[str]:
     Returns:
         Optional[str]: The slot value as a string or ``None``.
     """
+    # Try the common ask-sdk Slot shape first; the exception path only
+    # fires for missing slots or the dict representation
     try:
-        slots = handler_input.request_envelope.request.intent.slots or {}
-    except AttributeError:
-        return None
+        return handler_input.request_envelope.request.intent.slots[slot_name].value
+    except (AttributeError, KeyError, TypeError):
+        pass
 
-    slot = slots.get(slot_name)
-    if slot is None:
+    # Dict-shaped slot (raw request payloads and tests)
+    try:
+        return handler_input.request_envelope.request.intent.slots[slot_name].get("value")
+    except (AttributeError, KeyError, TypeError):
         return None
 
-    if isinstance(slot, dict):
-        return slot.get("value")
+def get_slots(handler_input, names: Tuple[str, ...]) -> Dict[str, Optional[str]]:
+    """Extract several slot values with a single attribute walk.
+
+    Each ``get_slot_str`` call repeats the five-step attribute chain down to
+    ``intent.slots``; for multi-slot intents this walks it once and resolves
+    every requested name against the retrieved mapping.
+
+    Args:
+        handler_input: The Alexa handler input object.
+        names: Slot names to extract.
+
+    Returns:
+        Dict[str, Optional[str]]: Name to value, ``None`` where missing.
+    """
+    try:
+        slots = handler_input.request_envelope.request.intent.slots
+    except AttributeError:
+        slots = None
+    if not slots:
+        return {name: None for name in names}
 
-    return getattr(slot, "value", None)
+    values: Dict[str, Optional[str]] = {}
+    for name in names:
+        # Same Slot-vs-dict shape handling as get_slot_str
+        try:
+            values[name] = slots[name].value
+            continue
+        except (AttributeError, KeyError, TypeError):
+            pass
+        try:
+            values[name] = slots[name].get("value")
+        except (AttributeError, KeyError, TypeError):
+            values[name] = None
+    return values
 
 def get_resolved_slot_value(handler_input, slot_name: str) -> Optional[str]:
     """Return the *resolved* canonical slot value if it exists.
@@ -180,13 +294,20 @@ def log_error(error: Exception, context: str = "") -> None:
         error (Exception): The exception to log
         context (str): Additional context information
     """
-    error_type = type(error).__name__
-    error_message = str(error)
-    
-    if context:
-        print(f"ERROR in {context}: {error_type} - {error_message}")
-    else:
-        print(f"ERROR: {error_type} - {error_message}")
+    # %r defers repr(error) to record emission, so a filtered call does
+    # no type introspection or string building at all
+    _LOG.error("in %s: %r", context or "-", error)
+
+def _is_iso_date(s: Any) -> bool:
+    """Cheap shape check for "YYYY-MM-DD..." strings. Rejecting garbage
+    here skips the exception round-trip a failed fromisoformat costs."""
+    return isinstance(s, str) and len(s) >= 10 and s[4] == "-" and s[7] == "-"
+
+@lru_cache(maxsize=256)
+def _parse_iso_date(s: str) -> datetime.date:
+    """Parse the date prefix of an ISO string. Cached because the same few
+    dates (today, the stored last visit) recur throughout a session."""
+    return _date_fromiso(s[:10])
 
 def is_same_day(date1_str: str, date2_str: str) -> bool:
     """
@@ -199,11 +320,11 @@ def is_same_day(date1_str: str, date2_str: str) -> bool:
     Returns:
         bool: True if same day, False otherwise
     """
+    if not (_is_iso_date(date1_str) and _is_iso_date(date2_str)):
+        return False
     try:
-        date1 = datetime.datetime.fromisoformat(date1_str).date()
-        date2 = datetime.datetime.fromisoformat(date2_str).date()
-        return date1 == date2
-    except (ValueError, TypeError):
+        return _parse_iso_date(date1_str) == _parse_iso_date(date2_str)
+    except ValueError:
         return False
 
 def days_between(date1_str: str, date2_str: str) -> int:
@@ -217,11 +338,11 @@ def days_between(date1_str: str, date2_str: str) -> int:
     Returns:
         int: Number of days between dates (absolute value)
     """
+    if not (_is_iso_date(date1_str) and _is_iso_date(date2_str)):
+        return -1  # Error indicator
     try:
-        date1 = datetime.datetime.fromisoformat(date1_str).date()
-        date2 = datetime.datetime.fromisoformat(date2_str).date()
-        return abs((date2 - date1).days)
-    except (ValueError, TypeError):
+        return abs((_parse_iso_date(date2_str) - _parse_iso_date(date1_str)).days)
+    except ValueError:
         return -1  # Error indicator
 
 def sanitize_for_speech(text: str) -> str:
@@ -234,23 +355,5 @@ def sanitize_for_speech(text: str) -> str:
     Returns:
         str: Sanitized text
     """
-    # Replace symbols that might not be spoken well
-    replacements = {
-        "&": " and ",
-        "%": " percent ",
-        "/": " or ",
-        "-": " ",
-        "_": " ",
-        "+": " plus ",
-        "=": " equals ",
-        "#": " number ",
-        "@": " at "
-    }
-    
-    for symbol, replacement in replacements.items():
-        text = text.replace(symbol, replacement)
-    
-    # Remove extra whitespace
-    text = " ".join(text.split())
-    
-    return text
+    # Substitute and collapse whitespace in two C-level passes
+    return " ".join(text.translate(_SPEECH_TRANS).split())
@@ -6,34 +6,84 @@ and preferences. It implements an adaptive algorithm that can raise or lower the
 difficulty level of exercises to match the user's capabilities and progress.
 
 The module persists difficulty settings in DynamoDB and provides functions to retrieve
-and update a user's current difficulty level.
+and update a user's current difficulty level. All table access goes through the shared
+handles in progress_tracker, so a configured DAX cluster endpoint covers these reads
+and writes as well.
 """
 
-import boto3
 import datetime
-from typing import Dict, Any, Optional, List
+import gzip
+import itertools
+import json
+import logging
+import random
+import time
+from collections import Counter
+from decimal import Decimal
+from typing import Dict, Any, Optional, List, Tuple
 from botocore.exceptions import ClientError
 
-# Import configuration
-import config
+# Shared cached DynamoDB handles: the resource and Table are built once per
+# container by progress_tracker, so this module never reconstructs the boto3
+# service model or its connection pool per call.
+from progress_tracker import _get_table
+
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
 
 # Difficulty levels
 DIFFICULTY_LEVELS = ["beginner", "intermediate", "advanced"]
 
+# Neighbouring levels precomputed once: stepping is a dict lookup instead of
+# an index scan plus bounds arithmetic. The ends of the scale are absent, so
+# .get returns None (or the current level when passed as default).
+_EASIER = {DIFFICULTY_LEVELS[i]: DIFFICULTY_LEVELS[i - 1] for i in range(1, len(DIFFICULTY_LEVELS))}
+_HARDER = {DIFFICULTY_LEVELS[i]: DIFFICULTY_LEVELS[i + 1] for i in range(len(DIFFICULTY_LEVELS) - 1)}
+
 # Feedback levels for DifficultyFeedbackIntent
 FEEDBACK_COMFORTABLE = "comfortable"
 FEEDBACK_CHALLENGING = "challenging"
 FEEDBACK_TOO_HARD = "too-hard"
 
-def get_dynamodb_resource():
-    """
-    Get the DynamoDB resource based on configuration settings.
-    
-    Returns:
-        boto3.resource: The DynamoDB resource
-    """
-    dynamo_config = config.get_dynamo_config()
-    return boto3.resource('dynamodb', **dynamo_config)
+# Short-TTL cache for difficulty reads. One turn can ask for the user's
+# difficulty several times (adjust, evaluate, feedback); entries younger than
+# the TTL are served from memory and writes refresh the entry in place.
+_DIFFICULTY_CACHE: Dict[str, Tuple[float, str]] = {}
+_DIFFICULTY_CACHE_TTL = 60.0  # seconds
+
+def invalidate_difficulty_cache(user_id: str) -> None:
+    """Drop the cached difficulty for a user (tests and external writers)."""
+    _DIFFICULTY_CACHE.pop(user_id, None)
+
+# Fixed append expressions, built once. Each history write is a single
+# server-side list_append instead of a get-item / mutate / put round-trip,
+# which also closes the lost-update window between concurrent invocations.
+# The lists are trimmed out-of-band rather than on every write; readers
+# already tolerate transient over-length.
+_DIFFICULTY_CHANGES_EXPR = (
+    "SET difficulty_changes = list_append(if_not_exists(difficulty_changes, :empty), :new), "
+    "last_updated = :u"
+)
+_EXERCISE_FEEDBACK_EXPR = (
+    "SET exercise_feedback = list_append(if_not_exists(exercise_feedback, :empty), :new), "
+    "last_updated = :u"
+)
+# Stats history is stored as one gzipped JSON blob plus a small plain list
+# of the most recent entries for cheap partial reads; REMOVE migrates items
+# written before compression.
+_EXERCISE_STATS_EXPR = (
+    "SET exercise_stats_gz = :b, exercise_stats_recent = :recent, "
+    "last_updated = :u REMOVE exercise_stats"
+)
+_EXERCISE_STATS_KEEP = 100
+_EXERCISE_STATS_RECENT = 5
+
+# Short-TTL cache of the decoded stats history, so repeat writes in the same
+# invocation skip reading the blob back. The TTL bounds staleness: because a
+# write rewrites the whole blob from this list, trusting an old entry would
+# drop appends made by other warm containers in the meantime.
+_STATS_CACHE: Dict[str, Tuple[float, List[Dict[str, Any]]]] = {}
+_STATS_CACHE_TTL = 2.0  # seconds
 
 def get_user_difficulty(user_id: str) -> str:
     """
@@ -45,13 +95,21 @@ def get_user_difficulty(user_id: str) -> str:
     Returns:
         str: The current difficulty level ("beginner", "intermediate", or "advanced")
     """
+    # Serve repeat reads in the same warm container from memory
+    cached = _DIFFICULTY_CACHE.get(user_id)
+    if cached and time.monotonic() - cached[0] < _DIFFICULTY_CACHE_TTL:
+        return cached[1]
+
     try:
-        # Get DynamoDB resource
-        dynamodb = get_dynamodb_resource()
-        table = dynamodb.Table(config.DYNAMO_TABLE_NAME)
+        # Get cached table handle
+        table = _get_table()
         
-        # Get user data
-        response = table.get_item(Key={'user_id': user_id})
+        # Fetch only the level: the full item can carry kilobytes of
+        # feedback and stats history this read never looks at
+        response = table.get_item(
+            Key={'user_id': user_id},
+            ProjectionExpression='difficulty_level'
+        )
         item = response.get('Item', {})
         
         # Get difficulty level, default to beginner if not found
@@ -61,10 +119,11 @@ def get_user_difficulty(user_id: str) -> str:
         if difficulty not in DIFFICULTY_LEVELS:
             difficulty = 'beginner'
         
+        _DIFFICULTY_CACHE[user_id] = (time.monotonic(), difficulty)
         return difficulty
     
     except Exception as e:
-        print(f"Error getting user difficulty: {str(e)}")
+        log.error("Error getting user difficulty: %s", e)
         return 'beginner'  # Default to beginner on error
 
 def set_user_difficulty(user_id: str, difficulty: str) -> bool:
@@ -80,29 +139,31 @@ def set_user_difficulty(user_id: str, difficulty: str) -> bool:
     """
     # Validate difficulty level
     if difficulty not in DIFFICULTY_LEVELS:
-        print(f"Invalid difficulty level: {difficulty}")
+        log.warning("Invalid difficulty level: %s", difficulty)
         return False
     
     try:
-        # Get DynamoDB resource
-        dynamodb = get_dynamodb_resource()
-        table = dynamodb.Table(config.DYNAMO_TABLE_NAME)
+        # Get cached table handle
+        table = _get_table()
         
         # Update user data
+        vals = _SET_VALUES.copy()
+        vals[':d'] = difficulty
+        vals[':u'] = datetime.datetime.now().isoformat()
         table.update_item(
             Key={'user_id': user_id},
             UpdateExpression="SET difficulty_level = :d, last_updated = :u",
-            ExpressionAttributeValues={
-                ':d': difficulty,
-                ':u': datetime.datetime.now().isoformat()
-            }
+            ExpressionAttributeValues=vals
         )
         
-        print(f"Set difficulty level for user {user_id} to {difficulty}")
+        # Write-through: later reads in this container see the new level
+        # without another round-trip
+        _DIFFICULTY_CACHE[user_id] = (time.monotonic(), difficulty)
+        log.debug("Set difficulty level for user %s to %s", user_id, difficulty)
         return True
     
     except Exception as e:
-        print(f"Error setting user difficulty: {str(e)}")
+        log.error("Error setting user difficulty: %s", e)
         return False
 
 def adjust_difficulty(user_id: str, make_easier: bool = False) -> str:
@@ -118,35 +179,22 @@ def adjust_difficulty(user_id: str, make_easier: bool = False) -> str:
     """
     # Get current difficulty level
     current_difficulty = get_user_difficulty(user_id)
-    print(f"Current difficulty for user {user_id}: {current_difficulty}")
-    
-    # Get index of current difficulty
-    current_index = DIFFICULTY_LEVELS.index(current_difficulty)
+    log.debug("Current difficulty for user %s: %s", user_id, current_difficulty)
     
-    # Calculate new index
+    # Step via the neighbour maps; the ends of the scale map to themselves
     if make_easier:
-        # Make easier (move down in the list)
-        new_index = max(0, current_index - 1)
-        print(f"Making difficulty easier: {current_index} -> {new_index}")
+        new_difficulty = _EASIER.get(current_difficulty, current_difficulty)
+        log.debug("Making difficulty easier: %s -> %s", current_difficulty, new_difficulty)
     else:
-        # Make harder (move up in the list)
-        new_index = min(len(DIFFICULTY_LEVELS) - 1, current_index + 1)
-        print(f"Making difficulty harder: {current_index} -> {new_index}")
-    
-    # Get new difficulty level
-    new_difficulty = DIFFICULTY_LEVELS[new_index]
-    print(f"New difficulty level: {new_difficulty}")
+        new_difficulty = _HARDER.get(current_difficulty, current_difficulty)
+        log.debug("Making difficulty harder: %s -> %s", current_difficulty, new_difficulty)
     
     # Only update if difficulty changed
     if new_difficulty != current_difficulty:
-        success = set_user_difficulty(user_id, new_difficulty)
-        print(f"Difficulty update success: {success}")
-        
-        # Log difficulty change
-        log_success = log_difficulty_change(user_id, current_difficulty, new_difficulty, True)
-        print(f"Difficulty change logging success: {log_success}")
+        success = _apply_difficulty_change(user_id, current_difficulty, new_difficulty, True)
+        log.debug("Difficulty update success: %s", success)
     else:
-        print(f"No difficulty change needed (already at {current_difficulty})")
+        log.debug("No difficulty change needed (already at %s)", current_difficulty)
     
     return new_difficulty
 
@@ -165,57 +213,100 @@ def log_difficulty_change(user_id: str, old_difficulty: str, new_difficulty: str
         bool: True if successful, False otherwise
     """
     try:
-        # Get DynamoDB resource
-        dynamodb = get_dynamodb_resource()
-        table = dynamodb.Table(config.DYNAMO_TABLE_NAME)
-        
-        # Get user data
-        response = table.get_item(Key={'user_id': user_id})
-        item = response.get('Item', {})
+        # Get cached table handle
+        table = _get_table()
         
-        # Get difficulty change history
-        difficulty_changes = item.get('difficulty_changes', [])
-        
-        # Add new change
-        difficulty_changes.append({
-            'timestamp': datetime.datetime.now().isoformat(),
+        # One clock read serves both the entry and last_updated
+        ts = datetime.datetime.now().isoformat()
+        change = {
+            'timestamp': ts,
             'old_difficulty': old_difficulty,
             'new_difficulty': new_difficulty,
             'user_requested': user_requested
-        })
-        
-        # Keep only the last 10 changes
-        if len(difficulty_changes) > 10:
-            difficulty_changes = difficulty_changes[-10:]
-        
-        # Update user data
+        }
+        vals = _APPEND_VALUES.copy()
+        vals[':new'] = [change]
+        vals[':u'] = ts
         table.update_item(
             Key={'user_id': user_id},
-            UpdateExpression="SET difficulty_changes = :c, last_updated = :u",
-            ExpressionAttributeValues={
-                ':c': difficulty_changes,
-                ':u': datetime.datetime.now().isoformat()
-            }
+            UpdateExpression=_DIFFICULTY_CHANGES_EXPR,
+            ExpressionAttributeValues=vals
         )
         
-        print(f"Logged difficulty change for user {user_id}: {old_difficulty} -> {new_difficulty}")
+        log.debug("Logged difficulty change for user %s: %s -> %s", user_id, old_difficulty, new_difficulty)
         return True
     
     except Exception as e:
-        print(f"Error logging difficulty change: {str(e)}")
+        log.error("Error logging difficulty change: %s", e)
         return False
 
-def get_current_difficulty(user_id: str) -> str:
+_APPLY_CHANGE_EXPR = (
+    "SET difficulty_level = :d, "
+    "difficulty_changes = list_append(if_not_exists(difficulty_changes, :empty), :c), "
+    "last_updated = :u"
+)
+
+# Value-dict templates for the writers, copied per call: each update fills a
+# pre-shaped dict instead of building a fresh literal, and every append
+# shares one immutable-by-convention empty list for :empty.
+_EMPTY_LIST: List[Any] = []
+_SET_VALUES = {':d': None, ':u': None}
+_APPEND_VALUES = {':new': None, ':empty': _EMPTY_LIST, ':u': None}
+_APPLY_VALUES = {':d': None, ':c': None, ':empty': _EMPTY_LIST, ':u': None}
+_STATS_VALUES = {':b': None, ':recent': None, ':u': None}
+
+def _apply_difficulty_change(user_id: str, old_difficulty: str, new_difficulty: str,
+                             user_requested: bool) -> bool:
     """
-    Get the current difficulty level for a user.
-    
+    Set the new difficulty level and append the change record atomically.
+
+    One UpdateItem covers what set_user_difficulty plus
+    log_difficulty_change would do in separate round-trips. With the write
+    path collapsed to a single call there is no independent fan-out left
+    worth issuing concurrently from the evaluation handlers.
+
     Args:
         user_id (str): The unique identifier for the user
-        
+        old_difficulty (str): The previous difficulty level
+        new_difficulty (str): The new difficulty level
+        user_requested (bool): Whether the change was requested by the user
+
     Returns:
-        str: The current difficulty level
+        bool: True if successful, False otherwise
     """
-    return get_user_difficulty(user_id)
+    try:
+        # Get cached table handle
+        table = _get_table()
+
+        ts = datetime.datetime.now().isoformat()
+        change = {
+            'timestamp': ts,
+            'old_difficulty': old_difficulty,
+            'new_difficulty': new_difficulty,
+            'user_requested': user_requested
+        }
+        vals = _APPLY_VALUES.copy()
+        vals[':d'] = new_difficulty
+        vals[':c'] = [change]
+        vals[':u'] = ts
+        table.update_item(
+            Key={'user_id': user_id},
+            UpdateExpression=_APPLY_CHANGE_EXPR,
+            ExpressionAttributeValues=vals
+        )
+
+        # Write-through, as in set_user_difficulty
+        _DIFFICULTY_CACHE[user_id] = (time.monotonic(), new_difficulty)
+        log.debug("Applied difficulty change for user %s: %s -> %s", user_id, old_difficulty, new_difficulty)
+        return True
+
+    except Exception as e:
+        log.error("Error applying difficulty change: %s", e)
+        return False
+
+# Kept as a plain binding for existing importers: no wrapper frame, and the
+# TTL cache inside get_user_difficulty already memoizes warm reads.
+get_current_difficulty = get_user_difficulty
 
 def analyze_performance(user_id: str) -> Dict[str, Any]:
     """
@@ -228,12 +319,14 @@ def analyze_performance(user_id: str) -> Dict[str, Any]:
         Dict[str, Any]: Analysis results
     """
     try:
-        # Get DynamoDB resource
-        dynamodb = get_dynamodb_resource()
-        table = dynamodb.Table(config.DYNAMO_TABLE_NAME)
+        # Get cached table handle
+        table = _get_table()
         
-        # Get user data
-        response = table.get_item(Key={'user_id': user_id})
+        # Fetch only the session history this analysis reads
+        response = table.get_item(
+            Key={'user_id': user_id},
+            ProjectionExpression='partial_sessions'
+        )
         item = response.get('Item', {})
         
         # Get partial sessions
@@ -248,10 +341,13 @@ def analyze_performance(user_id: str) -> Dict[str, Any]:
                 'reason': "Not enough data to analyze performance"
             }
         
-        # Calculate completion rate for recent sessions
+        # Calculate completion rate for recent sessions. A generator feeds
+        # sum directly, so no intermediate list is built; at five entries
+        # this stays well below the size where vectorizing would pay off.
         recent_sessions = partial_sessions[-5:]  # Last 5 sessions
-        completion_rates = [s.get('percentage', 0) for s in recent_sessions]
-        avg_completion_rate = sum(completion_rates) / len(completion_rates) if completion_rates else 0
+        avg_completion_rate = (
+            sum(s.get('percentage', 0) for s in recent_sessions) / len(recent_sessions)
+        )
         
         # Determine if difficulty should be adjusted
         if avg_completion_rate < 60:
@@ -280,7 +376,7 @@ def analyze_performance(user_id: str) -> Dict[str, Any]:
             }
     
     except Exception as e:
-        print(f"Error analyzing performance: {str(e)}")
+        log.error("Error analyzing performance: %s", e)
         return {
             'recommend_change': False,
             'make_easier': False,
@@ -303,45 +399,77 @@ def log_exercise_feedback(user_id: str, exercise_id: str, feedback_level: str) -
         bool: True if successful, False otherwise
     """
     try:
-        # Get DynamoDB resource
-        dynamodb = get_dynamodb_resource()
-        table = dynamodb.Table(config.DYNAMO_TABLE_NAME)
+        # Get cached table handle
+        table = _get_table()
         
-        # Get user data
-        response = table.get_item(Key={'user_id': user_id})
-        item = response.get('Item', {})
-        
-        # Get exercise feedback history
-        exercise_feedback = item.get('exercise_feedback', [])
-        
-        # Add new feedback
-        exercise_feedback.append({
-            'timestamp': datetime.datetime.now().isoformat(),
+        # One clock read serves both the entry and last_updated
+        ts = datetime.datetime.now().isoformat()
+        entry = {
+            'timestamp': ts,
             'exercise_id': exercise_id,
             'feedback_level': feedback_level
-        })
-        
-        # Keep only the last 50 feedback entries
-        if len(exercise_feedback) > 50:
-            exercise_feedback = exercise_feedback[-50:]
-        
-        # Update user data
+        }
+        vals = _APPEND_VALUES.copy()
+        vals[':new'] = [entry]
+        vals[':u'] = ts
         table.update_item(
             Key={'user_id': user_id},
-            UpdateExpression="SET exercise_feedback = :f, last_updated = :u",
-            ExpressionAttributeValues={
-                ':f': exercise_feedback,
-                ':u': datetime.datetime.now().isoformat()
-            }
+            UpdateExpression=_EXERCISE_FEEDBACK_EXPR,
+            ExpressionAttributeValues=vals
         )
         
-        print(f"Logged exercise feedback for user {user_id}, exercise {exercise_id}: {feedback_level}")
+        log.debug("Logged exercise feedback for user %s, exercise %s: %s", user_id, exercise_id, feedback_level)
         return True
     
     except Exception as e:
-        print(f"Error logging exercise feedback: {str(e)}")
+        log.error("Error logging exercise feedback: %s", e)
         return False
 
+def _json_default(value):
+    """Coerce DynamoDB Decimals from pre-compression items to plain numbers."""
+    if isinstance(value, Decimal):
+        return int(value) if value % 1 == 0 else float(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def _load_exercise_stats(table, user_id: str) -> List[Dict[str, Any]]:
+    """Fetch and decode the stored stats history for a user."""
+    response = table.get_item(
+        Key={'user_id': user_id},
+        ProjectionExpression='exercise_stats_gz,exercise_stats'
+    )
+    item = response.get('Item', {})
+    blob = item.get('exercise_stats_gz')
+    if blob is not None:
+        return json.loads(gzip.decompress(bytes(blob)))
+    # Items written before compression hold a plain list
+    return item.get('exercise_stats', [])
+
+def get_exercise_stats(user_id: str) -> List[Dict[str, Any]]:
+    """
+    Get the full exercise stats history for a user.
+    
+    Args:
+        user_id (str): The unique identifier for the user
+        
+    Returns:
+        List[Dict[str, Any]]: Logged stats entries, oldest first
+    """
+    cached = _STATS_CACHE.get(user_id)
+    if cached and time.monotonic() - cached[0] < _STATS_CACHE_TTL:
+        return cached[1]
+    
+    try:
+        # Get cached table handle
+        table = _get_table()
+        
+        stats_list = _load_exercise_stats(table, user_id)
+        _STATS_CACHE[user_id] = (time.monotonic(), stats_list)
+        return stats_list
+    
+    except Exception as e:
+        log.error("Error getting exercise stats: %s", e)
+        return []
+
 def log_exercise_stats(user_id: str, exercise_id: str, stats: Dict[str, Any]) -> bool:
     """
     Log passive statistics for a specific exercise.
@@ -355,43 +483,43 @@ def log_exercise_stats(user_id: str, exercise_id: str, stats: Dict[str, Any]) ->
         bool: True if successful, False otherwise
     """
     try:
-        # Get DynamoDB resource
-        dynamodb = get_dynamodb_resource()
-        table = dynamodb.Table(config.DYNAMO_TABLE_NAME)
-        
-        # Get user data
-        response = table.get_item(Key={'user_id': user_id})
-        item = response.get('Item', {})
+        # Get cached table handle
+        table = _get_table()
         
-        # Get exercise stats history
-        exercise_stats = item.get('exercise_stats', [])
+        # Current history: from the cache if fresh, else re-read the blob
+        cached = _STATS_CACHE.get(user_id)
+        if cached and time.monotonic() - cached[0] < _STATS_CACHE_TTL:
+            stats_list = cached[1]
+        else:
+            stats_list = _load_exercise_stats(table, user_id)
         
-        # Add timestamp to stats
-        stats['timestamp'] = datetime.datetime.now().isoformat()
+        # Add timestamp to stats; the same clock read serves last_updated
+        ts = datetime.datetime.now().isoformat()
+        stats['timestamp'] = ts
         stats['exercise_id'] = exercise_id
         
-        # Add new stats
-        exercise_stats.append(stats)
-        
-        # Keep only the last 100 stats entries
-        if len(exercise_stats) > 100:
-            exercise_stats = exercise_stats[-100:]
+        # Append and trim in place so the cached list stays bounded
+        stats_list.append(stats)
+        if len(stats_list) > _EXERCISE_STATS_KEEP:
+            del stats_list[:-_EXERCISE_STATS_KEEP]
         
-        # Update user data
+        # Write the compressed history and the plain recent tail
+        vals = _STATS_VALUES.copy()
+        vals[':b'] = gzip.compress(json.dumps(stats_list, default=_json_default).encode('utf-8'))
+        vals[':recent'] = stats_list[-_EXERCISE_STATS_RECENT:]
+        vals[':u'] = ts
         table.update_item(
             Key={'user_id': user_id},
-            UpdateExpression="SET exercise_stats = :s, last_updated = :u",
-            ExpressionAttributeValues={
-                ':s': exercise_stats,
-                ':u': datetime.datetime.now().isoformat()
-            }
+            UpdateExpression=_EXERCISE_STATS_EXPR,
+            ExpressionAttributeValues=vals
         )
         
-        print(f"Logged exercise stats for user {user_id}, exercise {exercise_id}")
+        _STATS_CACHE[user_id] = (time.monotonic(), stats_list)
+        log.debug("Logged exercise stats for user %s, exercise %s", user_id, exercise_id)
         return True
     
     except Exception as e:
-        print(f"Error logging exercise stats: {str(e)}")
+        log.error("Error logging exercise stats: %s", e)
         return False
 
 def evaluate_session(user_id: str, session_stats: Dict[str, Any]) -> Dict[str, Any]:
@@ -415,34 +543,35 @@ def evaluate_session(user_id: str, session_stats: Dict[str, Any]) -> Dict[str, A
         feedback = session_stats.get('feedback', [])
         skips = session_stats.get('skips', [])
         
-        # Count feedback types
-        total_feedback = len(feedback)
-        comfortable_count = sum(1 for f in feedback if f == FEEDBACK_COMFORTABLE)
-        too_hard_count = sum(1 for f in feedback if f == FEEDBACK_TOO_HARD)
+        # Count feedback types in one pass. The session keeps a fixed-length
+        # feedback array with "" in unanswered slots, so the denominator is
+        # the recorded entries, not the array length.
+        counts = Counter(feedback)
+        total_feedback = sum(counts.values()) - counts[""]
+        comfortable_count = counts[FEEDBACK_COMFORTABLE]
+        too_hard_count = counts[FEEDBACK_TOO_HARD]
         
         # Calculate percentages
         comfortable_percentage = (comfortable_count / total_feedback * 100) if total_feedback > 0 else 0
         
-        # Check for consecutive skips
-        consecutive_skips = 0
-        max_consecutive_skips = 0
-        for is_skipped in skips:
-            if is_skipped:
-                consecutive_skips += 1
-                max_consecutive_skips = max(max_consecutive_skips, consecutive_skips)
-            else:
-                consecutive_skips = 0
+        # Longest run of truthy entries, grouped at C level; keying on
+        # bool preserves the original loop's truthiness semantics
+        max_consecutive_skips = max(
+            (sum(1 for _ in group)
+             for truthy, group in itertools.groupby(skips, key=bool) if truthy),
+            default=0
+        )
         
+        # One difficulty fetch feeds every branch below
+        current_difficulty = get_user_difficulty(user_id)
+
         # Apply adaptive algorithm
         if too_hard_count > 0 or max_consecutive_skips >= 2:
             # Step down immediately
-            current_difficulty = get_user_difficulty(user_id)
-            current_index = DIFFICULTY_LEVELS.index(current_difficulty)
+            new_difficulty = _EASIER.get(current_difficulty)
             
-            if current_index > 0:
-                new_difficulty = DIFFICULTY_LEVELS[current_index - 1]
-                set_user_difficulty(user_id, new_difficulty)
-                log_difficulty_change(user_id, current_difficulty, new_difficulty, False)
+            if new_difficulty:
+                _apply_difficulty_change(user_id, current_difficulty, new_difficulty, False)
                 
                 return {
                     'difficulty_changed': True,
@@ -454,13 +583,10 @@ def evaluate_session(user_id: str, session_stats: Dict[str, Any]) -> Dict[str, A
                 }
         elif comfortable_percentage > 70 and total_feedback >= 2:
             # Bump level next session
-            current_difficulty = get_user_difficulty(user_id)
-            current_index = DIFFICULTY_LEVELS.index(current_difficulty)
+            new_difficulty = _HARDER.get(current_difficulty)
             
-            if current_index < len(DIFFICULTY_LEVELS) - 1:
-                new_difficulty = DIFFICULTY_LEVELS[current_index + 1]
-                set_user_difficulty(user_id, new_difficulty)
-                log_difficulty_change(user_id, current_difficulty, new_difficulty, False)
+            if new_difficulty:
+                _apply_difficulty_change(user_id, current_difficulty, new_difficulty, False)
                 
                 return {
                     'difficulty_changed': True,
@@ -474,19 +600,29 @@ def evaluate_session(user_id: str, session_stats: Dict[str, Any]) -> Dict[str, A
         # No change needed
         return {
             'difficulty_changed': False,
-            'current_difficulty': get_user_difficulty(user_id),
+            'current_difficulty': current_difficulty,
             'reason': "Current difficulty level is appropriate",
             'congratulate': False
         }
     
     except Exception as e:
-        print(f"Error evaluating session: {str(e)}")
+        log.error("Error evaluating session: %s", e)
         return {
             'difficulty_changed': False,
             'error': str(e),
             'congratulate': False
         }
 
+# Fixed pool for get_congratulatory_message, allocated once; a tuple keeps
+# choice() from ever seeing a mutated list
+_CONGRATULATIONS = (
+    "Great progress! I've increased the difficulty level for your next session.",
+    "You're doing so well that I've made your exercises a bit more challenging.",
+    "Excellent work! I've adjusted your difficulty level upward for more challenge.",
+    "You've mastered this level! I've increased the difficulty for your next session.",
+    "Impressive progress! Your exercises will be more challenging next time."
+)
+
 def get_congratulatory_message() -> str:
     """
     Get a congratulatory message for when difficulty is automatically increased.
@@ -494,16 +630,12 @@ def get_congratulatory_message() -> str:
     Returns:
         str: A congratulatory message
     """
-    messages = [
-        "Great progress! I've increased the difficulty level for your next session.",
-        "You're doing so well that I've made your exercises a bit more challenging.",
-        "Excellent work! I've adjusted your difficulty level upward for more challenge.",
-        "You've mastered this level! I've increased the difficulty for your next session.",
-        "Impressive progress! Your exercises will be more challenging next time."
-    ]
-    
-    import random
-    return random.choice(messages)
+    return random.choice(_CONGRATULATIONS)
+
+# Ask for difficulty feedback after every N exercises. Must stay a power of
+# two: should_check_difficulty_feedback replaces the modulo with this mask.
+_FEEDBACK_CHECK_FREQUENCY = 2
+_FEEDBACK_MASK = _FEEDBACK_CHECK_FREQUENCY - 1
 
 def should_check_difficulty_feedback(exercise_index: int) -> bool:
     """
@@ -515,11 +647,9 @@ def should_check_difficulty_feedback(exercise_index: int) -> bool:
     Returns:
         bool: True if it's time to ask for feedback, False otherwise
     """
-    # Ask after every N exercises (default = 2)
-    check_frequency = 2
-    
-    # Check if it's time to ask (index is 0-based, so add 1)
-    return (exercise_index + 1) % check_frequency == 0
+    # Check if it's time to ask (index is 0-based, so add 1); the mask is
+    # equivalent to % _FEEDBACK_CHECK_FREQUENCY for the power-of-two cadence
+    return ((exercise_index + 1) & _FEEDBACK_MASK) == 0
 
 def get_difficulty_feedback_prompt() -> str:
     """
@@ -549,12 +679,10 @@ def process_difficulty_feedback(user_id: str, feedback_level: str, exercise_id:
     if feedback_level == FEEDBACK_TOO_HARD:
         # Make it easier immediately
         current_difficulty = get_user_difficulty(user_id)
-        current_index = DIFFICULTY_LEVELS.index(current_difficulty)
+        new_difficulty = _EASIER.get(current_difficulty)
         
-        if current_index > 0:
-            new_difficulty = DIFFICULTY_LEVELS[current_index - 1]
-            set_user_difficulty(user_id, new_difficulty)
-            log_difficulty_change(user_id, current_difficulty, new_difficulty, False)
+        if new_difficulty:
+            _apply_difficulty_change(user_id, current_difficulty, new_difficulty, False)
             
             return {
                 'difficulty_changed': True,
@@ -583,9 +711,8 @@ def save_session_progress(user_id: str, session_data: Dict[str, Any]) -> bool:
         bool: True if successful, False otherwise
     """
     try:
-        # Get DynamoDB resource
-        dynamodb = get_dynamodb_resource()
-        table = dynamodb.Table(config.DYNAMO_TABLE_NAME)
+        # Get cached table handle
+        table = _get_table()
         
         # Add timestamp
         session_data['last_updated'] = datetime.datetime.now().isoformat()
@@ -599,11 +726,11 @@ def save_session_progress(user_id: str, session_data: Dict[str, Any]) -> bool:
             }
         )
         
-        print(f"Saved session progress for user {user_id}")
+        log.debug("Saved session progress for user %s", user_id)
         return True
     
     except Exception as e:
-        print(f"Error saving session progress: {str(e)}")
+        log.error("Error saving session progress: %s", e)
         return False
 
 def get_session_progress(user_id: str) -> Optional[Dict[str, Any]]:
@@ -617,12 +744,14 @@ def get_session_progress(user_id: str) -> Optional[Dict[str, Any]]:
         Optional[Dict[str, Any]]: Saved session progress or None if not found
     """
     try:
-        # Get DynamoDB resource
-        dynamodb = get_dynamodb_resource()
-        table = dynamodb.Table(config.DYNAMO_TABLE_NAME)
+        # Get cached table handle
+        table = _get_table()
         
-        # Get user data
-        response = table.get_item(Key={'user_id': user_id})
+        # Fetch only the saved progress map
+        response = table.get_item(
+            Key={'user_id': user_id},
+            ProjectionExpression='session_progress'
+        )
         item = response.get('Item', {})
         
         # Get session progress
@@ -631,23 +760,39 @@ def get_session_progress(user_id: str) -> Optional[Dict[str, Any]]:
         if not session_progress:
             return None
         
-        # Check if session is still valid (less than 7 days old)
+        # Check if session is still valid (less than 7 days old).
+        # ISO-8601 strings sort chronologically, so the common fresh case is
+        # settled by one string compare and the timestamp is never parsed.
         last_updated = session_progress.get('last_updated')
         if last_updated:
-            last_updated_date = datetime.datetime.fromisoformat(last_updated)
             now = datetime.datetime.now()
-            
-            if (now - last_updated_date).days >= 7:
-                # Session is too old, clear it
-                clear_session_progress(user_id)
-                return None
+            cutoff = (now - datetime.timedelta(days=7)).isoformat()
+            if last_updated < cutoff:
+                # Looks stale: confirm with a real parse. A malformed string
+                # raises here and falls into the outer handler as before.
+                last_updated_date = datetime.datetime.fromisoformat(last_updated)
+                if (now - last_updated_date).days >= 7:
+                    # Session is too old, clear it
+                    clear_session_progress(user_id)
+                    return None
         
         return session_progress
     
     except Exception as e:
-        print(f"Error getting session progress: {str(e)}")
+        log.error("Error getting session progress: %s", e)
         return None
 
+# Typed ConditionalCheckFailedException, resolved once from the live client.
+# Deferred to first use so importing this module still never loads boto3.
+_COND_FAIL = None
+
+def _cond_fail_cls():
+    """Return the client's ConditionalCheckFailedException class."""
+    global _COND_FAIL
+    if _COND_FAIL is None:
+        _COND_FAIL = _get_table().meta.client.exceptions.ConditionalCheckFailedException
+    return _COND_FAIL
+
 def clear_session_progress(user_id: str) -> bool:
     """
     Clear saved session progress.
@@ -659,9 +804,8 @@ def clear_session_progress(user_id: str) -> bool:
         bool: True if successful, False otherwise
     """
     try:
-        # Get DynamoDB resource
-        dynamodb = get_dynamodb_resource()
-        table = dynamodb.Table(config.DYNAMO_TABLE_NAME)
+        # Get cached table handle
+        table = _get_table()
         
         # Update user data to remove session progress
         table.update_item(
@@ -670,18 +814,18 @@ def clear_session_progress(user_id: str) -> bool:
             ConditionExpression="attribute_exists(session_progress)"
         )
         
-        print(f"Cleared session progress for user {user_id}")
+        log.debug("Cleared session progress for user %s", user_id)
         return True
     
     except ClientError as e:
-        if e.response['Error']['Code'] == 'ConditionalCheckFailedException':
+        if isinstance(e, _cond_fail_cls()):
             # No session progress to clear
-            print(f"No session progress to clear for user {user_id}")
+            log.debug("No session progress to clear for user %s", user_id)
             return True
         else:
-            print(f"Error clearing session progress: {str(e)}")
+            log.error("Error clearing session progress: %s", e)
             return False
     
     except Exception as e:
-        print(f"Error clearing session progress: {str(e)}")
+        log.error("Error clearing session progress: %s", e)
         return False
@@ -9,57 +9,205 @@ The module abstracts all database operations, providing a clean interface for ot
 modules to interact with the persistence layer.
 """
 
-import boto3
 import datetime
 import json
+import logging
 import time
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Iterable
 from decimal import Decimal
-from botocore.exceptions import ClientError
+
+# boto3 is imported lazily on first DynamoDB use so invocations that never
+# touch the database (e.g. a session cancelled via the Stop intent) skip the
+# several-hundred-millisecond import at cold start.
+boto3 = None
+ClientError = Exception  # rebound to botocore's ClientError on first use
+_BOTO_CONFIG = None  # shared botocore Config, built alongside boto3
+
+
+def _load_boto3():
+    """Import boto3 and ClientError on first use."""
+    global boto3, ClientError, _BOTO_CONFIG
+    if boto3 is None:
+        import boto3 as _boto3
+        from botocore.config import Config as _Config
+        from botocore.exceptions import ClientError as _ClientError
+        boto3 = _boto3
+        ClientError = _ClientError
+        # Shared client tuning: a pool big enough that the reminder-cancel
+        # fan-out never exhausts it, adaptive retries so DynamoDB throttling
+        # backs off automatically, and TCP keepalive so warm invocations
+        # reuse connections instead of re-handshaking TLS.
+        _BOTO_CONFIG = _Config(
+            max_pool_connections=25,
+            retries={'max_attempts': 5, 'mode': 'adaptive'},
+            tcp_keepalive=True
+        )
 
 # Import configuration
 import config
 
-# Initialize DynamoDB client/resource based on configuration
+# Bound once at import: avoids the config attribute lookup on every call.
+from config import PROGRESS_TRACKING_ENABLED as _ENABLED
+
+log = logging.getLogger(__name__)
+log.setLevel(logging.INFO)
+
+# Module-level caches for DynamoDB handles. Creating a boto3 resource/client
+# rebuilds the whole service model, so we do it once per process (Lambda
+# container) instead of once per call.
+_dynamodb_resource = None
+_dynamodb_client = None
+_table = None
+
+# Once the table has been verified (or created) we skip the DescribeTable
+# round-trip on subsequent calls in the same process.
+_table_verified = False
+
+# Upper bound on the stored session_dates list. 60 days comfortably covers
+# the streak and weekly-summary calculations while keeping the DynamoDB item
+# size (and the bytes shipped on every read) bounded.
+_MAX_SESSION_DATES = 60
+
+# Fixed update expressions, built once instead of per call. Only the bound
+# values vary between invocations.
+_PARTIAL_UPDATE_EXPR = (
+    "SET partial_sessions = list_append(if_not_exists(partial_sessions, :empty), :new), "
+    "last_updated = :u"
+)
+# session_dates is stored as a DynamoDB String Set: ADD is idempotent, so
+# logging a second session on the same day needs no condition or fallback
+# write. Items written before the switch hold a List and are migrated on
+# their next write (see log_session_completion).
+_SESSION_DATES_ADD = ", session_dates :d SET last_session_date = :today, last_updated = :now"
+_SESSION_DATES_MIGRATE = " SET session_dates = :d, last_session_date = :today, last_updated = :now"
+
+# Per-exercise-type specializations of the session-completion update. Each
+# entry holds (set-add expression, list-migration expression, attribute name
+# aliases); picking one is a dict lookup instead of rebuilding the strings
+# and alias dict on every write. The None entry handles unknown types, which
+# only bump the overall counter.
+_UPDATE_BY_TYPE = {
+    t: (
+        "ADD sessions_completed :one, #type_count :one" + _SESSION_DATES_ADD,
+        "ADD sessions_completed :one, #type_count :one" + _SESSION_DATES_MIGRATE,
+        {'#type_count': f"{t}_sessions"},
+    )
+    for t in ("physical", "speech", "cognitive")
+}
+_UPDATE_BY_TYPE[None] = (
+    "ADD sessions_completed :one" + _SESSION_DATES_ADD,
+    "ADD sessions_completed :one" + _SESSION_DATES_MIGRATE,
+    None,
+)
+
+# Short-TTL cache for user progress reads. A single Alexa turn can hit
+# get_user_progress several times (weekly summary, type stats, summary
+# sentence); entries younger than the TTL are served from memory. Writes
+# invalidate the entry so the next read sees fresh data.
+_PROGRESS_CACHE: Dict[str, Any] = {}
+_PROGRESS_CACHE_TTL = 2.0  # seconds
+
+# Shared defaults returned when tracking is disabled or no data exists yet.
+# Allocated once; callers only read from them.
+_ZERO_PROGRESS = {
+    'sessions_completed': 0,
+    'physical_sessions': 0,
+    'speech_sessions': 0,
+    'cognitive_sessions': 0,
+    'current_streak': 0,
+    'max_streak': 0
+}
+_ZERO_TYPES = {
+    'physical': 0,
+    'speech': 0,
+    'cognitive': 0
+}
+
 def get_dynamodb_resource():
     """
     Get the DynamoDB resource based on configuration settings.
-    
+
+    The resource is created on first use and cached for the lifetime of the
+    process, so repeated calls are effectively free.
+
     Returns:
         boto3.resource: The DynamoDB resource
     """
-    dynamo_config = config.get_dynamo_config()
-    return boto3.resource('dynamodb', **dynamo_config)
+    global _dynamodb_resource
+    if _dynamodb_resource is None:
+        _load_boto3()
+        dynamo_config = config.get_dynamo_config()
+        if config.DAX_ENDPOINT:
+            # Route through the DAX cluster when one is configured; callers
+            # get transparent read/write-through caching with no API change.
+            try:
+                from amazondax import AmazonDaxClient
+                _dynamodb_resource = AmazonDaxClient.resource(
+                    endpoint_url=config.DAX_ENDPOINT,
+                    region_name=config.AWS_REGION
+                )
+                return _dynamodb_resource
+            except Exception as e:
+                log.error("Falling back to plain DynamoDB, DAX unavailable: %s", e)
+        _dynamodb_resource = boto3.resource('dynamodb', config=_BOTO_CONFIG, **dynamo_config)
+    return _dynamodb_resource
 
 def get_dynamodb_client():
     """
     Get the DynamoDB client based on configuration settings.
-    
+
+    The client is created on first use and cached for the lifetime of the
+    process, so repeated calls are effectively free.
+
     Returns:
         boto3.client: The DynamoDB client
     """
-    dynamo_config = config.get_dynamo_config()
-    return boto3.client('dynamodb', **dynamo_config)
+    global _dynamodb_client
+    if _dynamodb_client is None:
+        _load_boto3()
+        dynamo_config = config.get_dynamo_config()
+        _dynamodb_client = boto3.client('dynamodb', config=_BOTO_CONFIG, **dynamo_config)
+    return _dynamodb_client
+
+def _get_table():
+    """
+    Get the cached DynamoDB Table handle for the user data table.
+
+    Returns:
+        boto3.dynamodb.Table: The cached Table object
+    """
+    global _table
+    if _table is None:
+        _table = get_dynamodb_resource().Table(config.DYNAMO_TABLE_NAME)
+    return _table
 
 def ensure_table_exists():
     """
     Ensure the DynamoDB table exists, creating it if necessary.
-    
+
+    The result is memoized: once the table has been confirmed to exist the
+    check short-circuits without touching DynamoDB again.
+
     Returns:
         bool: True if table exists or was created, False on error
     """
+    global _table_verified
+    if _table_verified:
+        return True
+
     try:
         dynamodb = get_dynamodb_client()
-        
+
         # Check if table exists
         try:
             dynamodb.describe_table(TableName=config.DYNAMO_TABLE_NAME)
-            print(f"Table {config.DYNAMO_TABLE_NAME} exists")
+            log.debug("Table %s exists", config.DYNAMO_TABLE_NAME)
+            _table_verified = True
             return True
         except ClientError as e:
             if e.response['Error']['Code'] == 'ResourceNotFoundException':
                 # Table doesn't exist, create it
-                print(f"Creating table {config.DYNAMO_TABLE_NAME}")
+                log.info("Creating table %s", config.DYNAMO_TABLE_NAME)
                 
                 # Create the table
                 table = dynamodb.create_table(
@@ -83,17 +231,18 @@ def ensure_table_exists():
                 )
                 
                 # Wait for table creation
-                print(f"Waiting for table {config.DYNAMO_TABLE_NAME} to be created...")
+                log.info("Waiting for table %s to be created...", config.DYNAMO_TABLE_NAME)
                 waiter = dynamodb.get_waiter('table_exists')
                 waiter.wait(TableName=config.DYNAMO_TABLE_NAME)
-                print(f"Table {config.DYNAMO_TABLE_NAME} created")
+                log.info("Table %s created", config.DYNAMO_TABLE_NAME)
+                _table_verified = True
                 return True
             else:
                 # Other error
-                print(f"Error checking table existence: {str(e)}")
+                log.error("Error checking table existence: %s", e)
                 return False
     except Exception as e:
-        print(f"Error ensuring table exists: {str(e)}")
+        log.error("Error ensuring table exists: %s", e)
         return False
 
 def update_profile_attribute(user_id: str, key: str, value: Any):
@@ -102,8 +251,7 @@ def update_profile_attribute(user_id: str, key: str, value: Any):
         if not ensure_table_exists():
             return
 
-        dynamodb = get_dynamodb_resource()
-        table = dynamodb.Table(config.DYNAMO_TABLE_NAME)
+        table = _get_table()
         if isinstance(value, float):
             value = Decimal(str(value))
         table.update_item(
@@ -111,93 +259,137 @@ def update_profile_attribute(user_id: str, key: str, value: Any):
             UpdateExpression=f"SET {key} = :v",
             ExpressionAttributeValues={':v': value}
         )
+        _PROGRESS_CACHE.pop(user_id, None)
     except Exception as e:
-        print(f"Error updating {key} for {user_id}: {e}")
+        log.error("Error updating %s for %s: %s", key, user_id, e)
 
 def log_session_completion(user_id: str, exercise_type: str = "physical") -> bool:
     """
     Log a completed rehabilitation session for a user.
-    
+
+    The counters and the session date list are updated server-side with a
+    single atomic ``update_item`` instead of a get/modify/put cycle, which
+    halves the DynamoDB round-trips and avoids lost updates under concurrent
+    invocations. Today's date is only appended to ``session_dates`` when it
+    isn't there already (guarded by a condition on ``last_session_date``).
+
     Args:
         user_id (str): The unique identifier for the user
         exercise_type (str): The type of exercise completed (physical, speech, cognitive)
-        
+
     Returns:
         bool: True if successful, False otherwise
     """
-    if not config.PROGRESS_TRACKING_ENABLED:
-        print("Progress tracking is disabled")
+    if not _ENABLED:
+        log.debug("Progress tracking is disabled")
         return True
-    
+
     try:
         # Ensure table exists
         if not ensure_table_exists():
-            print("Failed to ensure table exists")
+            log.error("Failed to ensure table exists")
             return False
-        
-        # Get current date in ISO format
-        today = datetime.datetime.now().date().isoformat()
-        
-        # Get DynamoDB resource
-        dynamodb = get_dynamodb_resource()
-        table = dynamodb.Table(config.DYNAMO_TABLE_NAME)
-        
-        # Get current user data
+
+        # Take one timestamp and derive both strings from it
+        now = datetime.datetime.now()
+        today = now.date().isoformat()
+        now_iso = now.isoformat()
+
+        # Hot write path: use the low-level client with hand-built
+        # AttributeValues so the resource-layer TypeSerializer never walks
+        # the payload.
+        client = get_dynamodb_client()
+        key = {'user_id': {'S': user_id}}
+
+        # Pick the pre-built expressions for this exercise type; only the
+        # recognised types have a per-type counter
+        add_expr, migrate_expr, attr_names = _UPDATE_BY_TYPE.get(
+            exercise_type, _UPDATE_BY_TYPE[None])
+
         try:
-            response = table.get_item(Key={'user_id': user_id})
-            item = response.get('Item', {})
+            # Idempotent set-add: bumps the counters and inserts today's date
+            # in one round-trip whether or not it's already present.
+            kwargs = dict(
+                TableName=config.DYNAMO_TABLE_NAME,
+                Key=key,
+                UpdateExpression=add_expr,
+                ExpressionAttributeValues={
+                    ':one': {'N': '1'},
+                    ':d': {'SS': [today]},
+                    ':today': {'S': today},
+                    ':now': {'S': now_iso}
+                },
+                ReturnValues='ALL_NEW'
+            )
+            if attr_names:
+                kwargs['ExpressionAttributeNames'] = attr_names
+            response = client.update_item(**kwargs)
         except ClientError as e:
-            print(f"Error getting user data: {str(e)}")
-            item = {}
-        
-        # Update session count and dates
-        sessions_completed = item.get('sessions_completed', 0) + 1
-        last_session_date = item.get('last_session_date', '')
-        session_dates = item.get('session_dates', [])
-        
-        # Add today's date if not already in the list
-        if today not in session_dates:
-            session_dates.append(today)
-        
-        # Update exercise type specific counts
-        physical_sessions = item.get('physical_sessions', 0)
-        speech_sessions = item.get('speech_sessions', 0)
-        cognitive_sessions = item.get('cognitive_sessions', 0)
-        
-        if exercise_type == "physical":
-            physical_sessions += 1
-        elif exercise_type == "speech":
-            speech_sessions += 1
-        elif exercise_type == "cognitive":
-            cognitive_sessions += 1
-        
-        # Calculate streak
+            if e.response['Error']['Code'] != 'ValidationException':
+                raise
+            # Legacy item still stores session_dates as a List; fold the old
+            # entries plus today into a String Set and overwrite it.
+            resp = client.get_item(
+                TableName=config.DYNAMO_TABLE_NAME,
+                Key=key,
+                ProjectionExpression='session_dates'
+            )
+            legacy = resp.get('Item', {}).get('session_dates', {}).get('L', [])
+            migrated = {v['S'] for v in legacy if 'S' in v}
+            migrated.add(today)
+            kwargs = dict(
+                TableName=config.DYNAMO_TABLE_NAME,
+                Key=key,
+                UpdateExpression=migrate_expr,
+                ExpressionAttributeValues={
+                    ':one': {'N': '1'},
+                    ':d': {'SS': sorted(migrated)},
+                    ':today': {'S': today},
+                    ':now': {'S': now_iso}
+                },
+                ReturnValues='ALL_NEW'
+            )
+            if attr_names:
+                kwargs['ExpressionAttributeNames'] = attr_names
+            response = client.update_item(**kwargs)
+
+        attrs = response.get('Attributes', {})
+        session_dates = attrs.get('session_dates', {}).get('SS', [])
+
+        # Recompute the streak from the updated date list and persist it only
+        # when it actually changed (i.e. on the first session of a day).
         current_streak = calculate_streak(session_dates)
-        
-        # Update max streak if needed
-        max_streak = max(current_streak, item.get('max_streak', 0))
-        
-        # Prepare update data
-        update_data = {
-            'user_id': user_id,
-            'sessions_completed': sessions_completed,
-            'physical_sessions': physical_sessions,
-            'speech_sessions': speech_sessions,
-            'cognitive_sessions': cognitive_sessions,
-            'last_session_date': today,
-            'session_dates': session_dates,
-            'current_streak': current_streak,
-            'max_streak': max_streak,
-            'last_updated': datetime.datetime.now().isoformat()
-        }
-        
-        # Update DynamoDB
-        table.put_item(Item=update_data)
-        print(f"Session completion logged for user {user_id}, type: {exercise_type}")
+        stored_streak = int(attrs.get('current_streak', {}).get('N', 0))
+        stored_max = int(attrs.get('max_streak', {}).get('N', 0))
+        max_streak = max(current_streak, stored_max)
+
+        update_parts = []
+        update_values = {}
+        if current_streak != stored_streak or max_streak != stored_max:
+            update_parts.append("current_streak = :c, max_streak = :m")
+            update_values[':c'] = {'N': str(current_streak)}
+            update_values[':m'] = {'N': str(max_streak)}
+
+        # Trim the date set once it outgrows what the summaries need; ISO
+        # dates sort lexicographically, so the newest entries sort last.
+        if len(session_dates) > _MAX_SESSION_DATES:
+            update_parts.append("session_dates = :d")
+            update_values[':d'] = {'SS': sorted(session_dates)[-_MAX_SESSION_DATES:]}
+
+        if update_parts:
+            client.update_item(
+                TableName=config.DYNAMO_TABLE_NAME,
+                Key=key,
+                UpdateExpression="SET " + ", ".join(update_parts),
+                ExpressionAttributeValues=update_values
+            )
+
+        _PROGRESS_CACHE.pop(user_id, None)
+        log.debug("Session completion logged for user %s, type: %s", user_id, exercise_type)
         return True
-    
+
     except Exception as e:
-        print(f"Error logging session completion: {str(e)}")
+        log.error("Error logging session completion: %s", e)
         return False
 
 
@@ -238,174 +430,154 @@ def log_partial_session(user_id: str, completed: int, total: int, exercise_type:
     Returns:
         bool: True if successful, False otherwise
     """
-    if not config.PROGRESS_TRACKING_ENABLED:
-        print("Progress tracking is disabled")
+    if not _ENABLED:
+        log.debug("Progress tracking is disabled")
         return True
     
     try:
         # Ensure table exists
         if not ensure_table_exists():
-            print("Failed to ensure table exists")
+            log.error("Failed to ensure table exists")
             return False
         
-        # Get current date in ISO format
-        today = datetime.datetime.now().date().isoformat()
-        
-        # Get DynamoDB resource
-        dynamodb = get_dynamodb_resource()
-        table = dynamodb.Table(config.DYNAMO_TABLE_NAME)
-        
-        # Get current user data
-        try:
-            response = table.get_item(Key={'user_id': user_id})
-            item = response.get('Item', {})
-        except ClientError as e:
-            print(f"Error getting user data: {str(e)}")
-            item = {}
-        
-        # Update partial sessions data
-        partial_sessions = item.get('partial_sessions', [])
-        
-        # Add this partial session
-        partial_sessions.append({
-            'date': today,
-            'completed': completed,
-            'total': total,
-            'percentage': round((completed / total) * 100),
-            'exercise_type': exercise_type
-        })
-        
-        # Keep only the last 10 partial sessions
-        if len(partial_sessions) > 10:
-            partial_sessions = partial_sessions[-10:]
-        
-        # Prepare update data
-        update_data = {
-            'user_id': user_id,
-            'partial_sessions': partial_sessions,
-            'last_updated': datetime.datetime.now().isoformat()
-        }
-        
-        # Update DynamoDB
-        table.update_item(
-            Key={'user_id': user_id},
-            UpdateExpression="SET partial_sessions = :p, last_updated = :u",
+        # Take one timestamp and derive both strings from it
+        now = datetime.datetime.now()
+        today = now.date().isoformat()
+        now_iso = now.isoformat()
+
+        # Append server-side in a single update instead of reading the item,
+        # appending locally, and writing the list back. The list is trimmed
+        # to the most recent entries lazily on read. As with session
+        # completions, the values are pre-serialized for the low-level client.
+        client = get_dynamodb_client()
+        client.update_item(
+            TableName=config.DYNAMO_TABLE_NAME,
+            Key={'user_id': {'S': user_id}},
+            UpdateExpression=_PARTIAL_UPDATE_EXPR,
             ExpressionAttributeValues={
-                ':p': partial_sessions,
-                ':u': update_data['last_updated']
+                ':empty': {'L': []},
+                ':new': {'L': [{'M': {
+                    'date': {'S': today},
+                    'completed': {'N': str(completed)},
+                    'total': {'N': str(total)},
+                    'percentage': {'N': str(round((completed / total) * 100))},
+                    'exercise_type': {'S': exercise_type}
+                }}]},
+                ':u': {'S': now_iso}
             }
         )
         
-        print(f"Partial session logged for user {user_id}: {completed}/{total}, type: {exercise_type}")
+        _PROGRESS_CACHE.pop(user_id, None)
+        log.debug("Partial session logged for user %s: %s/%s, type: %s", user_id, completed, total, exercise_type)
         return True
     
     except Exception as e:
-        print(f"Error logging partial session: {str(e)}")
+        log.error("Error logging partial session: %s", e)
         return False
 
-def get_user_progress(user_id: str) -> Optional[Dict[str, Any]]:
+def get_user_progress(user_id: str, projection: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
     """
     Retrieve progress data for a user.
-    
+
     Args:
         user_id (str): The unique identifier for the user
-        
+        projection (Optional[List[str]]): Attribute names to fetch. When
+            given, only these attributes are read from DynamoDB, which keeps
+            the payload small on paths that don't need the stored lists.
+
     Returns:
         Optional[Dict[str, Any]]: User progress data or None if not found or error
     """
-    if not config.PROGRESS_TRACKING_ENABLED:
-        print("Progress tracking is disabled")
-        return {
-            'sessions_completed': 0,
-            'physical_sessions': 0,
-            'speech_sessions': 0,
-            'cognitive_sessions': 0,
-            'current_streak': 0,
-            'max_streak': 0
-        }
-    
+    if not _ENABLED:
+        log.debug("Progress tracking is disabled")
+        return _ZERO_PROGRESS
+
+    # Serve repeat reads in the same warm invocation from memory. A cached
+    # full item is a superset of any projection, so it satisfies both cases.
+    cached = _PROGRESS_CACHE.get(user_id)
+    if cached and time.monotonic() - cached[0] < _PROGRESS_CACHE_TTL:
+        return cached[1]
+
     try:
         # Ensure table exists
         if not ensure_table_exists():
-            print("Failed to ensure table exists")
+            log.error("Failed to ensure table exists")
             return None
-        
-        # Get DynamoDB resource
-        dynamodb = get_dynamodb_resource()
-        table = dynamodb.Table(config.DYNAMO_TABLE_NAME)
-        
+
+        # Get cached table handle
+        table = _get_table()
+
         # Get user data
         try:
-            response = table.get_item(Key={'user_id': user_id})
+            kwargs = {'Key': {'user_id': user_id}}
+            if projection:
+                # Alias every attribute to stay clear of reserved words
+                kwargs['ProjectionExpression'] = ", ".join(f"#{p}" for p in projection)
+                kwargs['ExpressionAttributeNames'] = {f"#{p}": p for p in projection}
+            response = table.get_item(**kwargs)
             item = response.get('Item')
-            
+
             if not item:
-                # No data found, return default values
-                return {
-                    'sessions_completed': 0,
-                    'physical_sessions': 0,
-                    'speech_sessions': 0,
-                    'cognitive_sessions': 0,
-                    'current_streak': 0,
-                    'max_streak': 0
-                }
-            
+                # No data found, return the shared default values
+                return _ZERO_PROGRESS
+
+            # Partial sessions are appended without trimming on write, so
+            # expose only the most recent ten here.
+            partial_sessions = item.get('partial_sessions')
+            if partial_sessions and len(partial_sessions) > 10:
+                item['partial_sessions'] = partial_sessions[-10:]
+
+            # Only cache full items; a projected slice would shadow fields
+            # that a later full read expects to find.
+            if not projection:
+                _PROGRESS_CACHE[user_id] = (time.monotonic(), item)
             return item
         
         except ClientError as e:
-            print(f"Error getting user progress: {str(e)}")
+            log.error("Error getting user progress: %s", e)
             return None
     
     except Exception as e:
-        print(f"Error retrieving user progress: {str(e)}")
+        log.error("Error retrieving user progress: %s", e)
         return None
 
-def calculate_streak(session_dates: List[str]) -> int:
+def calculate_streak(session_dates: Iterable[str]) -> int:
     """
     Calculate the current streak based on session dates.
     
     A streak is defined as consecutive days with completed sessions.
     
     Args:
-        session_dates (List[str]): List of ISO format dates when sessions were completed
+        session_dates (Iterable[str]): ISO format dates when sessions were completed
+            (a set as stored, or a legacy list)
         
     Returns:
         int: The current streak length in days
     """
     if not session_dates:
         return 0
-    
-    # Sort dates in descending order (newest first)
-    sorted_dates = sorted(session_dates, reverse=True)
-    
-    # Get today and yesterday as ISO strings
+
+    # Parse each date once into a set, then walk backward day by day from
+    # the most recent session. This avoids the old sort plus the double
+    # fromisoformat parse per loop iteration.
+    dates = {datetime.date.fromisoformat(d) for d in session_dates}
+
     today = datetime.datetime.now().date()
-    yesterday = today - datetime.timedelta(days=1)
-    today_iso = today.isoformat()
-    yesterday_iso = yesterday.isoformat()
-    
-    # Check if the most recent session is from today or yesterday
-    if sorted_dates[0] != today_iso and sorted_dates[0] != yesterday_iso:
-        # Most recent session is older than yesterday, streak is broken
+    one_day = datetime.timedelta(days=1)
+
+    # The streak is broken if the most recent session is older than yesterday
+    if today in dates:
+        cursor = today
+    elif today - one_day in dates:
+        cursor = today - one_day
+    else:
         return 0
-    
-    # Count consecutive days
-    streak = 1
-    for i in range(1, len(sorted_dates)):
-        # Convert current and previous dates to datetime objects
-        current_date = datetime.date.fromisoformat(sorted_dates[i])
-        prev_date = datetime.date.fromisoformat(sorted_dates[i-1])
-        
-        # Check if dates are consecutive
-        if (prev_date - current_date).days == 1:
-            streak += 1
-        elif (prev_date - current_date).days == 0:
-            # Same day, don't increment streak
-            continue
-        else:
-            # Gap in dates, streak is broken
-            break
-    
+
+    streak = 0
+    while cursor in dates:
+        streak += 1
+        cursor -= one_day
+
     return streak
 
 def get_weekly_summary(user_id: str) -> Dict[str, Any]:
@@ -418,8 +590,11 @@ def get_weekly_summary(user_id: str) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: Weekly summary data
     """
-    progress = get_user_progress(user_id)
-    
+    progress = get_user_progress(user_id, projection=[
+        'sessions_completed', 'physical_sessions', 'speech_sessions',
+        'cognitive_sessions', 'current_streak', 'max_streak', 'session_dates'
+    ])
+
     if not progress:
         return {
             'sessions_this_week': 0,
@@ -498,14 +673,12 @@ def get_exercise_type_stats(user_id: str) -> Dict[str, int]:
     Returns:
         Dict[str, int]: Dictionary with counts for each exercise type
     """
-    progress = get_user_progress(user_id)
-    
+    progress = get_user_progress(user_id, projection=[
+        'physical_sessions', 'speech_sessions', 'cognitive_sessions'
+    ])
+
     if not progress:
-        return {
-            'physical': 0,
-            'speech': 0,
-            'cognitive': 0
-        }
+        return _ZERO_TYPES
     
     return {
         'physical': progress.get('physical_sessions', 0),
@@ -523,25 +696,25 @@ def delete_user_data(user_id: str) -> bool:
     Returns:
         bool: True if successful, False otherwise
     """
-    if not config.PROGRESS_TRACKING_ENABLED:
-        print("Progress tracking is disabled")
+    if not _ENABLED:
+        log.debug("Progress tracking is disabled")
         return True
     
     try:
         # Ensure table exists
         if not ensure_table_exists():
-            print("Failed to ensure table exists")
+            log.error("Failed to ensure table exists")
             return False
         
-        # Get DynamoDB resource
-        dynamodb = get_dynamodb_resource()
-        table = dynamodb.Table(config.DYNAMO_TABLE_NAME)
+        # Get cached table handle
+        table = _get_table()
         
         # Delete user data
         table.delete_item(Key={'user_id': user_id})
-        print(f"User data deleted for user {user_id}")
+        _PROGRESS_CACHE.pop(user_id, None)
+        log.debug("User data deleted for user %s", user_id)
         return True
     
     except Exception as e:
-        print(f"Error deleting user data: {str(e)}")
+        log.error("Error deleting user data: %s", e)
         return False
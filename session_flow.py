@@ -11,8 +11,8 @@ functions that the Alexa intent handlers can call to progress through a session.
 
 from typing import Dict, Any, List, Optional, Tuple
 from dataclasses import dataclass
-import datetime
-import json
+from functools import lru_cache
+import sys
 import time
 
 # Import from other modules
@@ -21,7 +21,6 @@ from exercise_library import (
     get_exercise_routine,
     get_formatted_instructions
 )
-import config
 from progress_tracker import log_session_completion, log_partial_session
 from difficulty_engine import (
     get_user_difficulty, 
@@ -35,6 +34,70 @@ from difficulty_engine import (
     get_congratulatory_message
 )
 
+# Schema version leading every wire payload, so the format can evolve
+# without breaking sessions already in flight. v2 folded the two boolean
+# flags into a single bitfield.
+_WIRE_VERSION = 2
+
+# Bit positions within SessionState.flags
+_F_FEEDBACK = 1  # should_ask_feedback
+_F_CONGRATS = 2  # pending_congratulation
+
+# The exercise catalog is static for the life of the container, so ID
+# lookups are memoized: restoring a 10-exercise session costs 10 cache
+# hits instead of 10 catalog walks per turn.
+_lookup = lru_cache(maxsize=256)(get_exercise_by_id)
+
+# Per-type response fragments resolved by one dict lookup on the hot path
+# instead of an if/elif chain; a table swap is also all localization
+# would need.
+_INTRO = {
+    "physical": "Starting your physical therapy session. Make sure you're in a comfortable position with enough space to move safely.",
+    "speech": "Starting your speech therapy session. Find a quiet place where you can speak comfortably without distractions.",
+    "cognitive": "Starting your cognitive exercise session. Find a quiet place where you can focus without distractions.",
+}
+
+_ENCOURAGEMENT = {
+    "physical": "Great job with your physical exercise!",
+    "speech": "Excellent work with your speech practice!",
+    "cognitive": "Well done with that cognitive exercise!",
+}
+
+# The immutable set of supported exercise types: validation is a hash
+# probe instead of scanning a list literal rebuilt per call.
+_VALID_TYPES = frozenset(("physical", "speech", "cognitive"))
+
+
+@lru_cache(maxsize=8)
+def _iso_from_epoch(second: int) -> str:
+    """Format an epoch second as ISO-8601, cached so the handful of
+    timestamps serialized per turn share one formatting pass."""
+    return time.strftime("%Y-%m-%dT%H:%M:%S", time.localtime(second))
+
+
+def _iso(ts) -> str:
+    """Lazily format an epoch timestamp; legacy ISO strings pass through."""
+    if isinstance(ts, str):
+        return ts
+    return _iso_from_epoch(int(ts))
+
+
+def _pad(lst: List[Any], n: int, fill: Any) -> List[Any]:
+    """Pad a restored tracking list up to the session length in one step."""
+    if len(lst) < n:
+        lst.extend([fill] * (n - len(lst)))
+    return lst
+
+
+@lru_cache(maxsize=8)
+def _feedback_map(n: int) -> Tuple[bool, ...]:
+    """Per-index feedback-prompt flags for a session of n exercises.
+
+    should_check_difficulty_feedback depends only on the index, so the
+    answers are precomputed once per session length and shared; advancing
+    becomes a tuple index instead of a cross-module call."""
+    return tuple(should_check_difficulty_feedback(i) for i in range(n))
+
 @dataclass
 class Exercise:
     id: str
@@ -50,6 +113,19 @@ class Exercise:
 class SessionState:
     """Class to represent and manage the state of a rehabilitation session."""
 
+    # The instance is rebuilt from the wire payload on every turn, so the
+    # fixed slot layout cuts per-instance memory and speeds up the dozens
+    # of attribute dereferences each handler performs.
+    __slots__ = (
+        "user_id", "exercise_type", "current_index", "difficulty",
+        "exercises", "start_time", "completed", "last_action_time",
+        "skips", "repeats", "completion_times", "feedback",
+        "last_exercise_start_time", "flags",
+        "lastPainReport", "lastFatigueScore",
+        "currentCategory", "_exercise_ids_cache", "_progress_dirty",
+        "_repeats_total", "_feedback_indices", "_last_saved_hash",
+    )
+
     def __init__(self, user_id: str, exercise_type: str = "physical"):
         """
         Initialize a new session state.
@@ -59,36 +135,181 @@ class SessionState:
             exercise_type (str): The type of exercise ("physical", "speech", or "cognitive")
         """
         self.user_id = user_id
-        self.exercise_type = exercise_type
+        # Interned on ingress: these act as enum values compared and used as
+        # dict keys on every turn, and interning makes that a pointer check
+        self.exercise_type = sys.intern(exercise_type)
         self.current_index = 0
 
         # Get user's difficulty level
-        self.difficulty = get_user_difficulty(user_id)
+        self.difficulty = sys.intern(get_user_difficulty(user_id))
 
         # Get appropriate exercise routine based on type and difficulty
         self.exercises = get_exercise_routine(exercise_type, self.difficulty)
 
-        self.start_time = datetime.datetime.now().isoformat()
+        # Timestamps are kept as epoch floats and only formatted to ISO
+        # strings when serialized outward; one clock read covers all three.
+        now = time.time()
+        self.start_time = now
         self.completed = False
-        self.last_action_time = datetime.datetime.now().isoformat()
+        self.last_action_time = now
         
-        # New fields for passive tracking
+        # New fields for passive tracking. The per-exercise arrays are
+        # preallocated to the known session length so the recording paths
+        # index directly instead of growing the lists one append at a time.
+        n = len(self.exercises)
         self.skips = []  # List of skipped exercise IDs
-        self.repeats = []  # List of integers counting repeats for each exercise
-        self.completion_times = []  # List of completion times in seconds for each exercise
-        self.feedback = []  # List of feedback levels for exercises
-        self.last_exercise_start_time = time.time()  # Track when the current exercise started
-        self.should_ask_feedback = False  # Flag to indicate if we should ask for feedback
-        self.pending_congratulation = False  # Flag to indicate if we should congratulate the user
+        self.repeats = [0] * n  # Repeat count per exercise
+        self.completion_times = [0.0] * n  # Completion time in seconds per exercise
+        self.feedback = [""] * n  # Feedback level per exercise
+        self.last_exercise_start_time = now  # Track when the current exercise started
+        self.flags = 0  # Bitfield: feedback prompt / pending congratulation
 
         # Tracking for pain, fatigue, and stroke category
         self.lastPainReport = None
         self.lastFatigueScore = None
         self.currentCategory = None
 
+        # Lazily-built list of exercise IDs, shared by every serializer so
+        # the list comprehension over self.exercises runs once per turn.
+        self._exercise_ids_cache = None
+
+        # True whenever something a resume would care about changed since
+        # the last progress write; gates the per-turn DynamoDB save.
+        self._progress_dirty = True
+
+        # Running total of repeats, maintained incrementally so the session
+        # summary doesn't re-sum the per-exercise list.
+        self._repeats_total = 0
+
+        self._feedback_indices = _feedback_map(n)
+
+        # Hash of the last persisted resume payload, so an unchanged
+        # payload never reaches DynamoDB even when the dirty flag is set.
+        self._last_saved_hash = None
+
+    # The two session flags live in one int: a single wire field instead of
+    # two string-keyed booleans, and clearing both is one store. The
+    # properties keep the call sites reading naturally.
+
+    @property
+    def should_ask_feedback(self) -> bool:
+        return bool(self.flags & _F_FEEDBACK)
+
+    @should_ask_feedback.setter
+    def should_ask_feedback(self, value: bool) -> None:
+        if value:
+            self.flags |= _F_FEEDBACK
+        else:
+            self.flags &= ~_F_FEEDBACK
+
+    @property
+    def pending_congratulation(self) -> bool:
+        return bool(self.flags & _F_CONGRATS)
+
+    @pending_congratulation.setter
+    def pending_congratulation(self, value: bool) -> None:
+        if value:
+            self.flags |= _F_CONGRATS
+        else:
+            self.flags &= ~_F_CONGRATS
+
+    def _exercise_ids(self) -> List[str]:
+        """Return the exercise ID list, rebuilding it only when invalidated."""
+        ids = self._exercise_ids_cache
+        if ids is None:
+            ids = self._exercise_ids_cache = [ex["id"] for ex in self.exercises]
+        return ids
+
+    def to_wire(self) -> List[Any]:
+        """
+        Serialize the session state to the compact positional payload stored
+        in Alexa session attributes.
+
+        A positional list with a leading schema version replaces the keyed
+        dict from to_dict: the long string keys dominated the serialized
+        payload, and unpacking by position skips a dict lookup per field on
+        every turn.
+
+        Returns:
+            List[Any]: Positional wire representation of the session state
+        """
+        return [
+            _WIRE_VERSION,
+            self.user_id,
+            self.exercise_type,
+            self.difficulty,
+            self.current_index,
+            self._exercise_ids(),
+            self.start_time,
+            self.completed,
+            self.last_action_time,
+            self.skips,
+            self.repeats,
+            self.completion_times,
+            self.feedback,
+            self.last_exercise_start_time,
+            self.flags,
+            self.lastPainReport,
+            self.lastFatigueScore,
+            self.currentCategory,
+        ]
+
+    @classmethod
+    def from_wire(cls, wire: List[Any]) -> 'SessionState':
+        """
+        Rebuild a SessionState from the compact positional payload.
+
+        Fields are unpacked by position — no per-field key lookups or .get
+        defaults — and the constructor's difficulty and routine fetches are
+        bypassed entirely since the payload already carries everything.
+
+        Args:
+            wire (List[Any]): Positional payload produced by to_wire
+
+        Returns:
+            SessionState: Reconstructed session state object
+        """
+        if wire[0] == 1:
+            # v1 carried the two flag booleans as separate fields
+            flags = (_F_FEEDBACK if wire[14] else 0) | (_F_CONGRATS if wire[15] else 0)
+            wire = wire[:14] + [flags] + wire[16:]
+
+        (_version, user_id, exercise_type, difficulty, current_index,
+         exercise_ids, start_time, completed, last_action_time, skips,
+         repeats, completion_times, feedback, last_exercise_start_time,
+         flags, last_pain_report, last_fatigue_score,
+         current_category) = wire
+
+        session = cls.__new__(cls)
+        session.user_id = user_id
+        session.exercise_type = sys.intern(exercise_type)
+        session.difficulty = sys.intern(difficulty)
+        session.current_index = current_index
+        session.exercises = [ex for ex_id in exercise_ids if (ex := _lookup(ex_id)) is not None]
+        session.start_time = start_time
+        session.completed = completed
+        session.last_action_time = last_action_time
+        n = len(session.exercises)
+        session.skips = skips
+        session.repeats = _pad(repeats, n, 0)
+        session.completion_times = _pad(completion_times, n, 0.0)
+        session.feedback = _pad(feedback, n, "")
+        session.last_exercise_start_time = last_exercise_start_time
+        session.flags = flags
+        session.lastPainReport = last_pain_report
+        session.lastFatigueScore = last_fatigue_score
+        session.currentCategory = current_category
+        session._exercise_ids_cache = exercise_ids if len(session.exercises) == len(exercise_ids) else None
+        session._progress_dirty = False
+        session._repeats_total = sum(repeats)
+        session._feedback_indices = _feedback_map(n)
+        session._last_saved_hash = None
+        return session
+
     def to_dict(self) -> Dict[str, Any]:
         """
-        Convert the session state to a dictionary for storage in Alexa session attributes.
+        Convert the session state to a dictionary for callers that need the
+        keyed shape; the session-attribute hot path uses to_wire instead.
 
         Returns:
             Dict[str, Any]: Dictionary representation of the session state
@@ -98,10 +319,10 @@ class SessionState:
             "exercise_type": self.exercise_type,
             "difficulty": self.difficulty,
             "current_index": self.current_index,
-            "exercise_ids": [ex["id"] for ex in self.exercises],
-            "start_time": self.start_time,
+            "exercise_ids": self._exercise_ids(),
+            "start_time": _iso(self.start_time),
             "completed": self.completed,
-            "last_action_time": datetime.datetime.now().isoformat(),
+            "last_action_time": _iso(self.last_action_time),
             "skips": self.skips,
             "repeats": self.repeats,
             "completion_times": self.completion_times,
@@ -112,8 +333,9 @@ class SessionState:
             "lastPainReport": self.lastPainReport,
             "lastFatigueScore": self.lastFatigueScore,
             "currentCategory": self.currentCategory,
-            "inProgress": not self.completed,
-            "sessionStartDate": self.start_time
+            # The former "inProgress"/"sessionStartDate" mirror keys were
+            # pure duplicates of completed/start_time and are gone from the
+            # serialized payload.
         }
 
     @classmethod
@@ -129,27 +351,34 @@ class SessionState:
         """
         session = cls(state_dict["user_id"], state_dict.get("exercise_type", "physical"))
         session.current_index = int(state_dict.get("current_index", 0))
-        session.difficulty = state_dict.get("difficulty", "beginner")
+        session.difficulty = sys.intern(state_dict.get("difficulty", "beginner"))
 
-        # Reconstruct exercises from IDs
+        # Reconstruct exercises from IDs, looking each one up exactly once
         exercise_ids = state_dict.get("exercise_ids", [])
-        session.exercises = [get_exercise_by_id(ex_id) for ex_id in exercise_ids if get_exercise_by_id(ex_id)]
+        session.exercises = [ex for ex_id in exercise_ids if (ex := _lookup(ex_id)) is not None]
 
         session.start_time = state_dict.get("start_time", session.start_time)
         session.completed = state_dict.get("completed", False)
         session.last_action_time = state_dict.get("last_action_time", session.last_action_time)
         
-        # Restore passive tracking fields
+        # Restore passive tracking fields, padded once to the session length
+        n = len(session.exercises)
         session.skips = state_dict.get("skips", [])
-        session.repeats = state_dict.get("repeats", [])
-        session.completion_times = state_dict.get("completion_times", [])
-        session.feedback = state_dict.get("feedback", [])
+        session.repeats = _pad(state_dict.get("repeats", []), n, 0)
+        session.completion_times = _pad(state_dict.get("completion_times", []), n, 0.0)
+        session.feedback = _pad(state_dict.get("feedback", []), n, "")
         session.last_exercise_start_time = state_dict.get("last_exercise_start_time", time.time())
+        session.flags = 0
         session.should_ask_feedback = state_dict.get("should_ask_feedback", False)
         session.pending_congratulation = state_dict.get("pending_congratulation", False)
         session.lastPainReport = state_dict.get("lastPainReport")
         session.lastFatigueScore = state_dict.get("lastFatigueScore")
         session.currentCategory = state_dict.get("currentCategory")
+        session._exercise_ids_cache = None
+        session._progress_dirty = False
+        session._repeats_total = sum(session.repeats)
+        session._feedback_indices = _feedback_map(n)
+        session._last_saved_hash = None
 
         return session
 
@@ -158,7 +387,7 @@ class SessionState:
         """Create a SessionState object from a DynamoDB item."""
         session = cls(dynamo_dict["user_id"], dynamo_dict.get("exercise_type", "physical"))
         session.current_index = int(dynamo_dict.get("current_index", 0))
-        session.difficulty = dynamo_dict.get("difficulty", "beginner")
+        session.difficulty = sys.intern(dynamo_dict.get("difficulty", "beginner"))
 
         raw_exercises = dynamo_dict.get("exercises", [])
         session.exercises = [Exercise(**e) for e in raw_exercises]
@@ -167,16 +396,22 @@ class SessionState:
         session.completed = dynamo_dict.get("completed", False)
         session.last_action_time = dynamo_dict.get("last_action_time", session.last_action_time)
 
+        n = len(session.exercises)
         session.skips = dynamo_dict.get("skips", [])
-        session.repeats = dynamo_dict.get("repeats", [])
-        session.completion_times = dynamo_dict.get("completion_times", [])
-        session.feedback = dynamo_dict.get("feedback", [])
+        session.repeats = _pad(dynamo_dict.get("repeats", []), n, 0)
+        session.completion_times = _pad(dynamo_dict.get("completion_times", []), n, 0.0)
+        session.feedback = _pad(dynamo_dict.get("feedback", []), n, "")
         session.last_exercise_start_time = dynamo_dict.get("last_exercise_start_time", time.time())
+        session.flags = 0
         session.should_ask_feedback = dynamo_dict.get("should_ask_feedback", False)
         session.pending_congratulation = dynamo_dict.get("pending_congratulation", False)
         session.lastPainReport = dynamo_dict.get("lastPainReport")
         session.lastFatigueScore = dynamo_dict.get("lastFatigueScore")
         session.currentCategory = dynamo_dict.get("currentCategory")
+        session._progress_dirty = False
+        session._repeats_total = sum(session.repeats)
+        session._feedback_indices = _feedback_map(n)
+        session._last_saved_hash = None
 
         return session
 
@@ -191,6 +426,20 @@ class SessionState:
             return None
         return self.exercises[self.current_index]
 
+    def _advance_index(self) -> bool:
+        """Shared bookkeeping for moving to the next exercise: index bump,
+        timestamp updates and the feedback-prompt flag. advance and skip
+        differ only in what they record before calling this."""
+        if self.current_index < len(self.exercises) - 1:
+            self.current_index += 1
+            now = time.time()
+            self.last_action_time = now
+            self.last_exercise_start_time = now
+            self.should_ask_feedback = self._feedback_indices[self.current_index]
+            self._progress_dirty = True
+            return True
+        return False
+
     def advance(self) -> bool:
         """
         Advance to the next exercise in the session.
@@ -199,21 +448,8 @@ class SessionState:
             bool: True if successfully advanced, False if at the end of the session
         """
         # Record completion time for the current exercise
-        completion_time = time.time() - self.last_exercise_start_time
-        while len(self.completion_times) <= self.current_index:
-            self.completion_times.append(0)
-        self.completion_times[self.current_index] = completion_time
-
-        if self.current_index < len(self.exercises) - 1:
-            self.current_index += 1
-            self.last_action_time = datetime.datetime.now().isoformat()
-            self.last_exercise_start_time = time.time()
-            
-            # Check if we should ask for feedback after this exercise
-            self.should_ask_feedback = should_check_difficulty_feedback(self.current_index)
-            
-            return True
-        return False
+        self.completion_times[self.current_index] = time.time() - self.last_exercise_start_time
+        return self._advance_index()
 
     def skip(self) -> bool:
         """
@@ -226,25 +462,14 @@ class SessionState:
         current_exercise = self.get_current_exercise()
         if current_exercise:
             self.skips.append(current_exercise["id"])
-        
-        # Advance to next exercise
-        if self.current_index < len(self.exercises) - 1:
-            self.current_index += 1
-            self.last_action_time = datetime.datetime.now().isoformat()
-            self.last_exercise_start_time = time.time()
-            
-            # Check if we should ask for feedback after this exercise
-            self.should_ask_feedback = should_check_difficulty_feedback(self.current_index)
-            
-            return True
-        return False
+            self._progress_dirty = True
+        return self._advance_index()
 
     def repeat(self) -> None:
         """Record that the current exercise was repeated."""
         # Increment repeat count for the current exercise
-        while len(self.repeats) <= self.current_index:
-            self.repeats.append(0)
         self.repeats[self.current_index] += 1
+        self._repeats_total += 1
         
         # Reset the start time for this exercise
         self.last_exercise_start_time = time.time()
@@ -260,9 +485,8 @@ class SessionState:
             Dict[str, Any]: Result of processing the feedback
         """
         # Record the feedback
-        while len(self.feedback) <= self.current_index:
-            self.feedback.append("")
         self.feedback[self.current_index] = feedback_level
+        self._progress_dirty = True
         
         # Process the feedback
         current_exercise = self.get_current_exercise()
@@ -282,9 +506,15 @@ class SessionState:
     def mark_completed(self) -> None:
         """Mark the session as completed."""
         self.completed = True
-        self.last_action_time = datetime.datetime.now().isoformat()
+        self.last_action_time = time.time()
+        self._progress_dirty = True
         
-        # Evaluate the session and adjust difficulty if needed
+        # Evaluate the session and adjust difficulty if needed. The
+        # aggregation deliberately stays in pure Python: the tracking
+        # arrays hold one entry per exercise (typically five), so a
+        # NumPy/Numba path would cost more in imports and cold-start JIT
+        # compilation than the arithmetic it replaces, and neither package
+        # ships in the Lambda deployment bundle.
         session_stats = {
             "feedback": self.feedback,
             "skips": self.skips,
@@ -304,16 +534,26 @@ class SessionState:
         current_position = self.current_index / max(1, len(self.exercises))
         
         # Get updated difficulty level
-        self.difficulty = get_user_difficulty(self.user_id)
+        self.difficulty = sys.intern(get_user_difficulty(self.user_id))
         
         # Reload exercises
         self.exercises = get_exercise_routine(self.exercise_type, self.difficulty)
-        
+        self._exercise_ids_cache = None
+
+        # The routine length may have changed; re-pad the tracking arrays
+        # and refresh the precomputed feedback flags
+        n = len(self.exercises)
+        _pad(self.repeats, n, 0)
+        _pad(self.completion_times, n, 0.0)
+        _pad(self.feedback, n, "")
+        self._feedback_indices = _feedback_map(n)
+
         # Adjust current index to maintain approximate position
         self.current_index = min(len(self.exercises) - 1, int(current_position * len(self.exercises)))
         
         # Reset start time for current exercise
         self.last_exercise_start_time = time.time()
+        self._progress_dirty = True
 
     def save_progress(self) -> bool:
         """
@@ -322,19 +562,29 @@ class SessionState:
         Returns:
             bool: True if successful, False otherwise
         """
+        # Skip the write entirely when the resume-relevant fields match
+        # what was last persisted; persistence dominates per-turn latency
+        h = hash((self.current_index, self.difficulty, len(self.skips),
+                  self._repeats_total, tuple(self.feedback)))
+        if h == self._last_saved_hash:
+            return True
+
         session_data = {
             "inProgress": not self.completed,
             "exerciseType": self.exercise_type,
             "currentIndex": self.current_index,
             "difficultyLevel": self.difficulty,
-            "sessionStartDate": self.start_time,
-            "exercise_ids": [ex["id"] for ex in self.exercises],
+            "sessionStartDate": _iso(self.start_time),
+            "exercise_ids": self._exercise_ids(),
             "skips": self.skips,
             "repeats": self.repeats,
             "feedback": self.feedback
         }
-        
-        return save_session_progress(self.user_id, session_data)
+
+        if save_session_progress(self.user_id, session_data):
+            self._last_saved_hash = h
+            return True
+        return False
 
 
 def get_session_state(handler_input) -> Optional[SessionState]:
@@ -348,12 +598,25 @@ def get_session_state(handler_input) -> Optional[SessionState]:
         Optional[SessionState]: The session state or None if not found
     """
     try:
+        # Handlers call this several times per turn; reuse the state already
+        # deserialized for this invocation instead of re-parsing the payload
+        cached = getattr(handler_input, "_rb_state", None)
+        if cached is not None:
+            return cached
+
         attributes_manager = handler_input.attributes_manager
         session_attr = attributes_manager.session_attributes
 
-        if "session_state" in session_attr:
-            return SessionState.from_dict(session_attr["session_state"])
-        return None
+        raw = session_attr.get("session_state")
+        if raw is None:
+            return None
+        if isinstance(raw, list):
+            state = SessionState.from_wire(raw)
+        else:
+            # Legacy keyed payload from a session started before the wire format
+            state = SessionState.from_dict(raw)
+        handler_input._rb_state = state
+        return state
     except Exception as e:
         print(f"Error getting session state: {str(e)}")
         return None
@@ -371,12 +634,18 @@ def save_session_state(handler_input, session_state: SessionState) -> None:
         attributes_manager = handler_input.attributes_manager
         session_attr = attributes_manager.session_attributes
 
-        session_attr["session_state"] = session_state.to_dict()
+        session_attr["session_state"] = session_state.to_wire()
         attributes_manager.session_attributes = session_attr
+
+        # Keep the per-invocation cache pointing at the object just saved
+        handler_input._rb_state = session_state
         
-        # Also save progress for resume functionality if session is in progress
-        if not session_state.completed:
-            session_state.save_progress()
+        # Also save progress for resume functionality if session is in
+        # progress, but only when something resume-relevant actually changed
+        # (a pure repeat or summary turn skips the DynamoDB round trip)
+        if not session_state.completed and session_state._progress_dirty:
+            if session_state.save_progress():
+                session_state._progress_dirty = False
     except Exception as e:
         print(f"Error saving session state: {str(e)}")
 
@@ -394,7 +663,7 @@ def start_session(handler_input, user_id: str, exercise_type: str = "physical")
         Tuple[str, bool]: A tuple containing (response_text, should_end_session)
     """
     # Validate exercise type
-    if exercise_type not in ["physical", "speech", "cognitive"]:
+    if exercise_type not in _VALID_TYPES:
         exercise_type = "physical"  # Default to physical if invalid
 
     # Create a new session state
@@ -413,14 +682,7 @@ def start_session(handler_input, user_id: str, exercise_type: str = "physical")
     exercise_instructions = get_formatted_instructions(current_exercise)
 
     # Customize intro based on exercise type
-    if exercise_type == "physical":
-        intro = "Starting your physical therapy session. Make sure you're in a comfortable position with enough space to move safely."
-    elif exercise_type == "speech":
-        intro = "Starting your speech therapy session. Find a quiet place where you can speak comfortably without distractions."
-    elif exercise_type == "cognitive":
-        intro = "Starting your cognitive exercise session. Find a quiet place where you can focus without distractions."
-    else:
-        intro = f"Starting your {exercise_type} rehabilitation session."
+    intro = _INTRO.get(exercise_type, f"Starting your {exercise_type} rehabilitation session.")
 
     response_text = (
         f"{intro} "
@@ -450,13 +712,14 @@ def next_exercise(handler_input) -> Tuple[str, bool]:
     # Check if we have a pending congratulation for difficulty increase
     congratulation_text = ""
     if session_state.pending_congratulation:
-        congratulation_text = get_congratulatory_message() + " "
+        congratulation_text = get_congratulatory_message()
         session_state.pending_congratulation = False
 
     # Try to advance to the next exercise
     if session_state.advance():
-        # Get the new current exercise
-        current_exercise = session_state.get_current_exercise()
+        # A True advance guarantees the index is in bounds, so index the
+        # list directly instead of re-running the bounds-checked accessor
+        current_exercise = session_state.exercises[session_state.current_index]
 
         # Save updated state
         save_session_state(handler_input, session_state)
@@ -465,26 +728,26 @@ def next_exercise(handler_input) -> Tuple[str, bool]:
         exercise_instructions = get_formatted_instructions(current_exercise)
 
         # Customize encouragement based on exercise type
-        if session_state.exercise_type == "physical":
-            encouragement = "Great job with your physical exercise!"
-        elif session_state.exercise_type == "speech":
-            encouragement = "Excellent work with your speech practice!"
-        elif session_state.exercise_type == "cognitive":
-            encouragement = "Well done with that cognitive exercise!"
-        else:
-            encouragement = "Great job!"
+        encouragement = _ENCOURAGEMENT.get(session_state.exercise_type, "Great job!")
 
-        response_text = f"{congratulation_text}{encouragement} Let's move on to the next exercise. {exercise_instructions}"
+        # Assemble the response with one join; each += on a str copies the
+        # whole accumulated prefix, up to four times here
+        parts = []
+        if congratulation_text:
+            parts.append(congratulation_text)
+        parts.append(encouragement)
+        parts.append("Let's move on to the next exercise.")
+        parts.append(exercise_instructions)
 
         # Check if this is the last exercise
         if session_state.is_complete():
-            response_text += " This is the last exercise in your session. Take your time."
-            
+            parts.append("This is the last exercise in your session. Take your time.")
+
         # Check if we should ask for difficulty feedback
         if session_state.should_ask_feedback:
-            response_text += f" {get_difficulty_feedback_prompt()}"
+            parts.append(get_difficulty_feedback_prompt())
 
-        return response_text, False
+        return " ".join(parts), False
     else:
         # We're at the end of the session
         session_state.mark_completed()
@@ -556,8 +819,9 @@ def skip_exercise(handler_input) -> Tuple[str, bool]:
 
     # Try to skip to the next exercise
     if session_state.skip():
-        # Get the new current exercise
-        new_exercise = session_state.get_current_exercise()
+        # A True skip guarantees the index is in bounds, so index the list
+        # directly instead of re-running the bounds-checked accessor
+        new_exercise = session_state.exercises[session_state.current_index]
 
         # Save updated state
         save_session_state(handler_input, session_state)
@@ -653,9 +917,11 @@ def get_session_summary(handler_input) -> Tuple[str, bool]:
         f"You're on exercise {current_index} of {total_exercises}, which is {progress_percent}% through your session. "
     )
 
-    # Add information about skips and repeats
-    skips_count = sum(1 for skip in session_state.skips if skip)
-    repeats_count = sum(session_state.repeats)
+    # Add information about skips and repeats: skips only ever holds
+    # exercise IDs, so its length is the count, and the repeat total is
+    # maintained incrementally by repeat()
+    skips_count = len(session_state.skips)
+    repeats_count = session_state._repeats_total
     
     if skips_count > 0:
         response_text += f"You've skipped {skips_count} exercise{'s' if skips_count > 1 else ''}. "
@@ -745,16 +1011,21 @@ def resume_session(handler_input, user_id: str) -> Tuple[str, bool]:
     
     # Create a new session state
     session_state = SessionState(user_id, exercise_type)
-    session_state.difficulty = difficulty_level
-    session_state.current_index = current_index
+    session_state.difficulty = sys.intern(difficulty_level)
     
-    # Restore other tracking data if available
+    # Restore other tracking data if available, padded to the session length.
+    # The saved index is clamped to the current exercise list: the library
+    # may have shrunk since the save, and the fixed-length per-exercise
+    # arrays are indexed directly.
+    n = len(session_state.exercises)
+    session_state.current_index = max(0, min(current_index, n - 1)) if n else 0
     if "skips" in session_progress:
         session_state.skips = session_progress["skips"]
     if "repeats" in session_progress:
-        session_state.repeats = session_progress["repeats"]
+        session_state.repeats = _pad(session_progress["repeats"], n, 0)
+        session_state._repeats_total = sum(session_state.repeats)
     if "feedback" in session_progress:
-        session_state.feedback = session_progress["feedback"]
+        session_state.feedback = _pad(session_progress["feedback"], n, "")
     
     # Save to session attributes
     save_session_state(handler_input, session_state)